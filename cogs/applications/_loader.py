@@ -13,6 +13,40 @@ Dependencies:
 """
 
 import interactions as ipy
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+def _prefetch(ext: str):
+    """
+    Imports an extension module ahead of loading so `load_extension` finds it in `sys.modules`.
+
+    Import errors are ignored here; `load_extension` raises them again and they are
+    reported through `_safe_load`.
+
+    Args:
+        ext (str): The dotted path of the extension to import.
+    """
+    try:
+        importlib.import_module(ext)
+    except Exception:
+        pass
+
+def _safe_load(bot: ipy.Client, ext: str) -> Exception | None:
+    """
+    Loads a single extension, capturing any failure instead of raising it.
+
+    Args:
+        bot (ipy.Client): The main bot instance.
+        ext (str): The dotted path of the extension to load.
+
+    Returns:
+        Exception | None: The error raised while loading, or None on success.
+    """
+    try:
+        bot.load_extension(ext)
+    except Exception as e:
+        return e
+    return None
 
 class ApplicationLoader(ipy.Extension):
     """
@@ -31,7 +65,6 @@ class ApplicationLoader(ipy.Extension):
             bot (ipy.Client): The main bot instance.
         """
         self.bot = bot
-        print("➤ Loading Application Modules...")
         
         # Registry of sub-extensions to be loaded.
         # These paths must correspond to valid python modules relative to the run directory.
@@ -43,17 +76,25 @@ class ApplicationLoader(ipy.Extension):
             "extensions.apps.misc"
         ]
         
-        # Iterate through the registry and attempt to load each module.
-        # We use a try-except block here to ensure that a failure in one module
+        # Warm up the import machinery in parallel so the file lookups and bytecode reads overlap.
+        # Extensions are still loaded one by one on this thread below.
+        with ThreadPoolExecutor(max_workers=len(self.app_extensions)) as executor:
+            list(executor.map(_prefetch, self.app_extensions))
+
+        # Attempt to load each module in the registry.
+        # Failures are captured by `_safe_load` so that a failure in one module
         # does not prevent the others from loading.
-        for ext in self.app_extensions:
-            try:
-                self.bot.load_extension(ext)
-                print(f"  ✓ Loaded {ext}")
-            except Exception as e:
-                # Log the specific error to console for debugging.
-                # In a production environment, this should ideally use the logging module.
-                print(f"  ✕ Failed to load {ext}: {e}")
+        results = [(ext, _safe_load(self.bot, ext)) for ext in self.app_extensions]
+
+        # Report all load results in a single print instead of one write per module.
+        report = ["➤ Loading Application Modules..."]
+        for ext, error in results:
+            if error is None:
+                report.append(f"  ✓ Loaded {ext}")
+            else:
+                report.append(f"  ✕ Failed to load {ext}: {error}")
+
+        print("\n".join(report))
 
 def setup(bot: ipy.Client):
     """
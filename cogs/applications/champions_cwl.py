@@ -11,12 +11,24 @@ Dependencies:
 """
 
 import interactions as ipy
+import asyncio
 
 # Explicit imports are preferred over wildcard (*) imports for clarity and debugging
 from core.emojis_manager import get_app_emoji
-from core.utils import extract_integer, extract_alphabets
+from core.utils import verify_applicant, NOT_APPLICANT_MESSAGE, INTERVIEW_STARTED_MESSAGE
 from core.models import COLOR
-from core import server_setup as sc
+
+# Questionnaire text is kept as a template so the arrow emoji is resolved once per click.
+# Application emojis are fetched at runtime, so they cannot be frozen at import time.
+QUESTIONS_DESCRIPTION = (
+    "{arrow}1. Send the tag of your Clash of Clans account. \n"
+    "{arrow}2. What armies are you using currently? \n"
+    "{arrow}3. Please send a screenshot of your current base layout (traps included).\n"
+    "{arrow}4. What CWL level did you play last month? And how many stars did you get? "
+    "(Example: Master 2 - 18 Stars) \n"
+    "{arrow}Before continuing, be aware that Champions CWL requires "
+    "strict commitment. Do not apply if you are a casual player."
+)
 
 class ChampionsApplication(ipy.Extension):
     """
@@ -31,6 +43,33 @@ class ChampionsApplication(ipy.Extension):
             bot (ipy.Client): The main bot instance.
         """
         self.bot = bot
+        # The questionnaire embed is identical for every click, so it is built once and reused.
+        # It is only rebuilt if the arrow emoji resolves differently (e.g. after emojis are fetched).
+        self._questions_embed: ipy.Embed | None = None
+        self._embed_arrow: str | None = None
+
+    def _get_questions_embed(self) -> ipy.Embed:
+        """
+        Returns the questionnaire embed, building it only when needed.
+
+        Returns:
+            ipy.Embed: The cached questionnaire embed.
+        """
+        arrow = get_app_emoji('arrow')
+
+        if self._questions_embed is None or self._embed_arrow != arrow:
+            # Construct the Interview Questionnaire Embed
+            self._questions_embed = ipy.Embed(
+                title="**Answer these questions in this ticket:**",
+                description=QUESTIONS_DESCRIPTION.format(arrow=arrow),
+                footer=ipy.EmbedFooter(
+                    text="Feel free to ask for help for any confusions."
+                ),
+                color=COLOR
+            )
+            self._embed_arrow = arrow
+
+        return self._questions_embed
 
     @ipy.component_callback("champions_start_button")
     async def champions_apply(self, ctx: ipy.ComponentContext):
@@ -43,56 +82,27 @@ class ChampionsApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
-
         # Security & Identity Check:
         # Verify that the user clicking the button is actually the applicant (ticket owner).
         # The check passes if EITHER:
         # 1. The ID in the channel topic matches the user's ID.
         # 2. The username in the channel name matches the user's name (formatted).
         # This dual-check provides a fallback if the topic is empty or the name format varies.
-        
-        user_id_match = extract_integer(ctx.channel.topic) == int(member.id)
-        
-        # Note: Assumes channel format includes a separator "┃" (e.g., "ticket┃username")
-        try:
-            channel_username = ctx.channel.name.split("┃")[1]
-            username_match = extract_alphabets(member.username) == channel_username
-        except IndexError:
-            # Handle cases where channel name doesn't follow the split format
-            username_match = False
-
-        # If both checks fail, deny the interaction.
-        if not user_id_match and not username_match:
+        # The cheap topic ID comparison runs first so the username regex only runs when it fails.
+        # Both values are parsed once per channel and served from cache on repeated clicks.
+        if not verify_applicant(ctx):
             await ctx.send(
-                f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
+                NOT_APPLICANT_MESSAGE.format(error=get_app_emoji('error')),
                 ephemeral=True
             )
             return
 
-        # Defer interaction to prevent timeout while constructing the response
-        await ctx.defer(ephemeral=True)
-          
-        # Construct the Interview Questionnaire Embed
-        embed = ipy.Embed(
-            title="**Answer these questions in this ticket:**",
-            description=(
-                f"{get_app_emoji('arrow')}1. Send the tag of your Clash of Clans account. \n"
-                f"{get_app_emoji('arrow')}2. What armies are you using currently? \n"
-                f"{get_app_emoji('arrow')}3. Please send a screenshot of your current base layout (traps included).\n"
-                f"{get_app_emoji('arrow')}4. What CWL level did you play last month? And how many stars did you get? "
-                "(Example: Master 2 - 18 Stars) \n"
-                f"{get_app_emoji('arrow')}Before continuing, be aware that Champions CWL requires "
-                "strict commitment. Do not apply if you are a casual player."
-            ),
-            footer=ipy.EmbedFooter(
-                text="Feel free to ask for help for any confusions."
-            ),
-            color=COLOR
+        # The ephemeral confirmation acknowledges the interaction directly, so no defer round-trip is needed.
+        # The questions are posted to the channel concurrently with the acknowledgement.
+        await asyncio.gather(
+            ctx.send(INTERVIEW_STARTED_MESSAGE.format(success=get_app_emoji('success')), ephemeral=True),
+            ctx.channel.send(embeds=[self._get_questions_embed()])
         )
-        
-        # Post the questions to the channel for the user to answer
-        msg = await ctx.channel.send(embeds=[embed])
 
 def setup(bot: ipy.Client):
     """
@@ -14,15 +14,26 @@ Dependencies:
 """
 
 import interactions as ipy
+import asyncio
 
 # Explicit imports used to maintain code clarity and avoid namespace pollution
-from core.utils import extract_integer, extract_alphabets
+from core.utils import verify_applicant, NOT_APPLICANT_MESSAGE, INTERVIEW_STARTED_MESSAGE
 from core import server_setup as sc
 from core.emojis_manager import get_app_emoji
 # Note: 'COLOR' was used but not imported in the original file. 
 # Importing it from core.models to ensure execution safety.
 from core.models import COLOR 
 
+# Questionnaire text is kept as a template so the arrow emoji is resolved once per click.
+# Application emojis are fetched at runtime, so they cannot be frozen at import time.
+QUESTIONS_DESCRIPTION = (
+    "{arrow}1. Send the tag of your Clash of Clans account.\n"
+    "{arrow}2. Which armies do you currently play, or which ones are you interested in learning? "
+    "Let us know what you’re familiar with or what you’d like to explore so we can match you with the right support.\n"
+    "{arrow}3. During which hour range of the day are you available for the coaching? "
+    "Answer must be in UTC. Please use this converter: https://dateful.com/convert/utc"
+)
+
 class CoachingApplication(ipy.Extension):
     """
     Manages the interactive components and logic for the Coaching Application system.
@@ -36,6 +47,34 @@ class CoachingApplication(ipy.Extension):
             bot (ipy.Client): The main bot instance.
         """
         self.bot = bot
+        # The questionnaire embed is identical for every click, so it is built once and reused.
+        # It is only rebuilt if the arrow emoji resolves differently (e.g. after emojis are fetched).
+        self._questions_embed: ipy.Embed | None = None
+        self._embed_arrow: str | None = None
+
+    def _get_questions_embed(self) -> ipy.Embed:
+        """
+        Returns the questionnaire embed, building it only when needed.
+
+        Returns:
+            ipy.Embed: The cached questionnaire embed.
+        """
+        arrow = get_app_emoji('arrow')
+
+        if self._questions_embed is None or self._embed_arrow != arrow:
+            # Construct the Questionnaire Embed
+            # Focuses on player tag, specific army composition interests, and scheduling.
+            self._questions_embed = ipy.Embed(
+                title="**Please respond all of the following in the chat:**",
+                description=QUESTIONS_DESCRIPTION.format(arrow=arrow),
+                footer=ipy.EmbedFooter(
+                    text="Feel free to ask for help for any confusions."
+                ),
+                color=COLOR
+            )
+            self._embed_arrow = arrow
+
+        return self._questions_embed
 
     @ipy.component_callback("coaching_start_button")
     async def coaching_apply(self, ctx: ipy.ComponentContext):
@@ -48,56 +87,42 @@ class CoachingApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
-
         # Identity Verification:
         # Ensure that the user clicking the button is the owner of the ticket.
         # Checks against both the User ID in the channel topic and the Username in the channel name.
-        is_topic_owner = extract_integer(ctx.channel.topic) == int(member.id)
-        
-        # Safe extraction of username from channel name (format: ticket┃username)
-        try:
-            channel_user_part = ctx.channel.name.split("┃")[1]
-            is_name_owner = extract_alphabets(member.username) == channel_user_part
-        except IndexError:
-            is_name_owner = False
-
-        if not is_topic_owner and not is_name_owner:
+        # The username regex only runs when the cheaper topic ID comparison fails.
+        # Both values are parsed once per channel and served from cache on repeated clicks.
+        if not verify_applicant(ctx):
             await ctx.send(
-                f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
+                NOT_APPLICANT_MESSAGE.format(error=get_app_emoji('error')),
                 ephemeral=True
             )
             return
 
-        # Defer the interaction to allow time for processing and config retrieval
-        await ctx.defer(ephemeral=True)
-
-        # Construct the Questionnaire Embed
-        # Focuses on player tag, specific army composition interests, and scheduling.
-        embed = ipy.Embed(
-            title="**Please respond all of the following in the chat:**",
-            description=(
-                f"{get_app_emoji('arrow')}1. Send the tag of your Clash of Clans account.\n"
-                f"{get_app_emoji('arrow')}2. Which armies do you currently play, or which ones are you interested in learning? "
-                "Let us know what you’re familiar with or what you’d like to explore so we can match you with the right support.\n"
-                f"{get_app_emoji('arrow')}3. During which hour range of the day are you available for the coaching? "
-                "Answer must be in UTC. Please use this converter: https://dateful.com/convert/utc"
-            ),
-            footer=ipy.EmbedFooter(
-                text="Feel free to ask for help for any confusions."
-            ),
-            color=COLOR
-        )
-        
         # Retrieve Dynamic Server Configuration
         # This ensures we ping the correct Role ID even if it changes in the database.
         config: sc.GuildConfig = sc.get_config(ctx.guild.id)
-        
+
+        # The ephemeral confirmation acknowledges the interaction directly, so no defer round-trip is needed.
+        # The staff alert and questionnaire are posted concurrently with the acknowledgement.
+        await asyncio.gather(
+            ctx.send(INTERVIEW_STARTED_MESSAGE.format(success=get_app_emoji('success')), ephemeral=True),
+            self._post_questionnaire(ctx.channel, config.COACH_ROLE)
+        )
+
+    async def _post_questionnaire(self, channel: ipy.GuildText, coach_role: int | None):
+        """
+        Alerts the coaching staff and posts the questionnaire, in that order.
+
+        Args:
+            channel (ipy.GuildText): The ticket channel.
+            coach_role (int | None): The ID of the coaching role to mention.
+        """
         # Alert the Coaching Staff via role mention
-        await ctx.channel.send(f"<@&{config.COACH_ROLE}>")
-        
+        await channel.send(f"<@&{coach_role}>")
+
         # Post the questionnaire
-        msg = await ctx.channel.send(embeds=[embed])   
+        await channel.send(embeds=[self._get_questions_embed()])
 
 def setup(bot: ipy.Client):
     """
@@ -21,9 +21,7 @@ Dependencies:
 import interactions as ipy
 import asyncio
 import secrets
-import json
 import random
-import copy
 import coc
 
 # Explicit imports to maintain code clarity and traceability
@@ -46,6 +44,48 @@ class ClanApplication(ipy.Extension):
             bot (ipy.Client): The main bot instance.
         """
         self.bot: ipy.Client = bot
+        # Recruiting competitive clans bucketed by Town Hall level, rebuilt whenever a new config is loaded
+        self._clans_source: dict | None = None
+        self._clan_th_bounds: dict[str, tuple[int, int | None]] = {}
+        self._eligible_by_th: dict[int, list[str]] = {}
+
+    def _get_eligible_clans(self, clans_config: dict[str, AllianceClanData], town_hall: int) -> list[str]:
+        """
+        Returns the recruiting competitive clans whose Town Hall range includes `town_hall`.
+
+        The static filters (recruitment, clan type, TH range) are evaluated once per loaded
+        config object; `fetch_json` returns the same object until the file changes on disk.
+        Each Town Hall bucket is built the first time it is requested.
+
+        Args:
+            clans_config (dict[str, AllianceClanData]): The loaded clan configuration.
+            town_hall (int): The Town Hall level of the applicant.
+
+        Returns:
+            list[str]: The eligible clan tags, in config order. Callers must not mutate it.
+        """
+        if clans_config is not self._clans_source:
+            # Parse the TH bounds of the clans that pass the recruitment and type filters
+            self._clan_th_bounds = {
+                key: (
+                    extract_integer(value["requirement"]),
+                    extract_integer(value["maximum_possibleTH"]) if value.get("maximum_possibleTH") else None
+                )
+                for key, value in clans_config.items()
+                if value["recruitment"] and value["type"] not in ("FWA", "CWL")
+            }
+            self._eligible_by_th = {}
+            self._clans_source = clans_config
+
+        eligible = self._eligible_by_th.get(town_hall)
+        if eligible is None:
+            eligible = [
+                key for key, (min_th, max_th) in self._clan_th_bounds.items()
+                if min_th <= town_hall and (not max_th or town_hall <= max_th)
+            ]
+            self._eligible_by_th[town_hall] = eligible
+
+        return eligible
 
     @ipy.component_callback("clan_start_button")
     async def apply_clan(self, ctx: ipy.ComponentContext):
@@ -59,15 +99,13 @@ class ClanApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
-        
         # Identity Verification:
         # Ensure that the user clicking the button is the owner of the ticket.
         # Checks against both the User ID in the channel topic and the Username in the channel name.
-        if extract_integer(ctx.channel.topic) != int(member.id) and \
-                extract_alphabets(member.username) != ctx.channel.name.split("┃")[1]:
+        # The cheap (cached) ID comparison runs first; the username regex only runs when it fails.
+        if not verify_applicant(ctx):
             await ctx.send(f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
-                            ephemeral=True)
+                           ephemeral=True)
             return
 
         # Defer the interaction to prevent timeout while fetching data
@@ -96,23 +134,31 @@ class ClanApplication(ipy.Extension):
         account_tags = []
         jump_url = ctx.message.jump_url if ctx.message else ""
         
-        # Load linked accounts from local storage
-        player_links = json.load(open("data/member_tags.json", "r"))
+        # Load linked accounts from local storage (served from memory while the file is unchanged).
+        # The shared links data is only read here, the interview does not change the saved links.
+        player_links = await fetch_json("data/member_tags.json")
         player_select = None
-        d_player_select = None
         player = None
         player_options = {}
+        # Player objects resolved so far, reused instead of fetching the same tag again
+        players_by_tag: dict[str, coc.Player] = {}
         
-        # Iterate through linked tags for the user, verifying they exist in the API
-        for tag in copy.deepcopy(player_links.get(str(ctx.author.id), [])):
-            try:
-                player = await fetch_player(self.bot.coc, tag)
-            except coc.errors.NotFound:
-                # Remove invalid tags from the local cache
-                player_links[str(ctx.author.id)].remove(tag)
+        # Verify every linked tag of the user against the API concurrently
+        linked_tags = list(player_links.get(str(ctx.author.id), []))
+        linked_players = await asyncio.gather(
+            *(fetch_player(self.bot.coc, tag) for tag in linked_tags), return_exceptions=True
+        )
+
+        for tag, player in zip(linked_tags, linked_players):
+            if isinstance(player, coc.errors.NotFound):
+                # Invalid tags are left out of the selection menu
                 continue
+            if isinstance(player, BaseException):
+                raise player
+
+            players_by_tag[player.tag] = player
         
-            townhall_emoji = ipy.PartialEmoji.from_str(get_app_emoji(f"Townhall{player.town_hall}"))
+            townhall_emoji = get_townhall_emoji(player.town_hall)
         
             # Create a selection option for each valid linked account
             player_options[player.tag] = ipy.StringSelectOption(
@@ -129,7 +175,6 @@ class ClanApplication(ipy.Extension):
                 placeholder="👤 Apply with your linked accounts",
                 custom_id="player_apply_select"
             )
-            d_player_select = copy.deepcopy(player_select)
         
         # Display instructions for providing an account tag (manual entry or selection)
         embed = ipy.Embed(
@@ -146,84 +191,98 @@ class ClanApplication(ipy.Extension):
         msg = await ctx.channel.send(embeds=[embed], components=player_select)
         
         fails = 0
-        # Main loop to wait for user input (either message or component interaction)
-        while True:
-            wait_tasks = [
-                asyncio.create_task(
-                    self.bot.wait_for("on_message_create", checks=msg_check, timeout=600),
-                    name="message"
-                )
-            ]
-            if player_select:
-                wait_tasks.append(
-                    asyncio.create_task(
-                        self.bot.wait_for_component(
-                            components=player_select, check=check, messages=int(msg.id), timeout=600),
-                        name="select"
-                    )
-                )
+        # The retry prompt is built once for the step rather than on every invalid response
+        invalid_tag_message = INVALID_TAG_MESSAGE.format(error=get_app_emoji('error'))
+        # The waiters are created once and only the one that fired is replaced on the next pass,
+        # so an invalid chat message doesn't tear down and rebuild the pending dropdown wait.
+        message_task: asyncio.Task | None = None
+        select_task: asyncio.Task | None = None
+
+        # A single deadline covers the whole step instead of a separate timer on every waiter
+        deadline = asyncio.timeout(600)
+
+        try:
+            async with deadline:
+                # Main loop to wait for user input (either message or component interaction)
+                while True:
+                    if message_task is None:
+                        message_task = asyncio.create_task(
+                            self.bot.wait_for("on_message_create", checks=msg_check),
+                            name="message"
+                        )
+                    if player_select and select_task is None:
+                        select_task = asyncio.create_task(
+                            self.bot.wait_for_component(
+                                components=player_select, check=check, messages=int(msg.id)),
+                            name="select"
+                        )
+
+                    # Wait for the first completed task (message or select)
+                    wait_tasks = [task for task in (message_task, select_task) if task]
+                    done, _ = await asyncio.wait(wait_tasks, return_when=asyncio.FIRST_COMPLETED)
+                    finished: asyncio.Task = select_task if select_task in done else message_task
+
+                    # Release the task that fired so it is recreated if the loop continues
+                    if finished is message_task:
+                        message_task = None
+                    else:
+                        select_task = None
+
+                    action_name = finished.get_name()
         
-            # Wait for the first completed task (message or select)
-            done, pending = await asyncio.wait(wait_tasks, return_when=asyncio.FIRST_COMPLETED)
-            finished: asyncio.Task = list(done)[0]
+                    action_result: ipy.events.MessageCreate | ipy.events.Component = finished.result()
         
-            # Cancel any remaining tasks
-            for task in pending:
-                try:
-                    task.cancel()
-                except asyncio.CancelledError:
-                    pass
+                    # Handle Manual Tag Entry via Message
+                    if action_name == "message":
+                        # Only the first valid tag is used, so validation stops there
+                        valid_tag = await extract_first_tag(self.bot.coc, action_result.message.content)
+                        if not valid_tag:
+                            if fails == 3:
+                                await msg.edit(embed=FAIL_EMBED, components=CLAN_RESTART_BUTTON)
+                                raise asyncio.exceptions.CancelledError
         
-            action_name = finished.get_name()
+                            try:
+                                await ctx.send(invalid_tag_message, ephemeral=True)
+                            except ipy.errors.HTTPException:
+                                await ctx.channel.send(invalid_tag_message, ephemeral=True)
         
-            try:
-                action_result: ipy.events.MessageCreate | ipy.events.Component = finished.result()
-            except asyncio.TimeoutError:
-                raise ComponentTimeoutError(message=msg)
+                            fails += 1
+                            continue
         
-            # Handle Manual Tag Entry via Message
-            if action_name == "message":
-                valid_tags = await extract_tags(self.bot.coc, action_result.message.content)
-                if not valid_tags:
-                    if fails == 3:
-                        await msg.edit(embed=FAIL_EMBED, components=CLAN_RESTART_BUTTON)
-                        raise asyncio.exceptions.CancelledError
+                        player = await fetch_player(self.bot.coc, valid_tag)
         
-                    try:
-                        await ctx.send(f"{get_app_emoji('error')} Please provide a valid tag in the chat.", ephemeral=True)
-                    except ipy.errors.HTTPException:
-                        await ctx.channel.send(f"{get_app_emoji('error')} Please provide a valid tag in the chat.",
-                                                ephemeral=True)
+                        # Update UI to reflect manual entry success
+                        # The menu is disabled in place; it is not waited on again after this point.
+                        if player_select:
+                            player_select.disabled = True
+                            player_select.placeholder = f"✅ Player tag is provided in chat"
         
-                    fails += 1
-                    continue
-        
-                player = await fetch_player(self.bot.coc, valid_tags[0])
-        
-                # Update UI to reflect manual entry success
-                if player_select:
-                    d_player_select.disabled = True
-                    d_player_select.placeholder = f"✅ Player tag is provided in chat"
+                            await msg.edit(components=player_select)
         
-                    await msg.edit(components=d_player_select)
-        
-            # Handle Account Selection via Dropdown
-            else:
-                player = await fetch_player(self.bot.coc, action_result.ctx.values[0])
+                    # Handle Account Selection via Dropdown
+                    else:
+                        selected_tag = action_result.ctx.values[0]
+                        player = players_by_tag.get(selected_tag) or await fetch_player(self.bot.coc, selected_tag)
         
-                d_player_select.disabled = True
-                d_player_select.placeholder = f"✅ {player.name} ({player.tag}) is selected"
+                        player_select.disabled = True
+                        player_select.placeholder = f"✅ {player.name} ({player.tag}) is selected"
         
-                await action_result.ctx.edit_origin(components=d_player_select)
+                        await action_result.ctx.edit_origin(components=player_select)
         
-            # Add selected tag to list and save if not already linked
-            account_tags.append(player.tag)
-            player_links = json.load(open("data/member_tags.json", "r"))
-            player_links_reversed = reverse_dict(player_links)
-        
-            if player.tag not in player_links_reversed:
-                player_links.setdefault(str(ctx.author.id), []).append(player.tag)
-            break
+                    # Add selected tag to list
+                    account_tags.append(player.tag)
+                    players_by_tag[player.tag] = player
+                    break
+        except TimeoutError:
+            # Only the step deadline counts as the user timing out
+            if not deadline.expired():
+                raise
+            raise ComponentTimeoutError(message=msg)
+        finally:
+            # Cancel any waiter that is still pending
+            for task in (message_task, select_task):
+                if task and not task.done():
+                    task.cancel()
 
         # Clan Generation Logic
         embed = ipy.Embed(
@@ -237,124 +296,90 @@ class ClanApplication(ipy.Extension):
         msg = await ctx.channel.send(embeds=[embed])
 
         # Load clan configurations and package data
-        clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
-        packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
+        clans_config: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
+        packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
         package_token = secrets.token_hex(8)
-        account_tags = list(set(account_tags))
+        account_tags = list(dict.fromkeys(account_tags))
 
-        normal_clans = [i for i in list(clans_config.keys())]
-        random.shuffle(normal_clans)
-        
         clan_options = {}
         clan_actionrows = []
         acc_clan = {}
         
         # Filter available clans for each account based on requirements
-        for count, account in enumerate(account_tags, start=1):
-            player = await fetch_player(self.bot.coc, account)
-            hero_sum = 0
-            for hero in player.heroes:
-                if hero.is_home_base:
-                    hero_sum += hero.level
-
-            clan_count = 0
+        # Accounts resolved earlier are reused; any others are fetched concurrently up front
+        missing_tags = [account for account in account_tags if account not in players_by_tag]
+        fetched_players = await asyncio.gather(*(fetch_player(self.bot.coc, account) for account in missing_tags))
+        players_by_tag.update(zip(missing_tags, fetched_players))
+        players = [players_by_tag[account] for account in account_tags]
+
+        for count, (account, player) in enumerate(zip(account_tags, players), start=1):
             acc_clan[account] = None
-            for key in normal_clans:
-                try:
-                    value = clans_config[key]
-                except KeyError:
-                    continue
+            eligible_keys = []
+            # Only clans already passing the recruitment, type and TH filters are considered.
+            # The whole bucket is sampled (a shuffled copy) rather than only 30 entries, because
+            # custom checks may still reject some clans and the 30-option cap counts qualified clans.
+            pool = self._get_eligible_clans(clans_config, player.town_hall)
+            candidates = random.sample(pool, k=len(pool))
+
+            for key in candidates:
+                value = clans_config[key]
 
                 # Limit displayed options to 30 clans max
-                if clan_count >= 30:
+                if len(eligible_keys) >= 30:
                     break
 
-                # Filter based on clan settings (recruitment open, type, etc.)
-                if not value["recruitment"]:
-                    continue
-
-                if value["type"] == "FWA":
-                    continue
-
-                if value["type"] == "CWL":
-                    continue                  
-
-                # Check Town Hall requirements
-                if extract_integer(value['requirement']) > player.town_hall:
-                    continue
-                max_th_str = value.get("maximum_possibleTH")
-                if max_th_str and player.town_hall > extract_integer(max_th_str):
-                    continue
-
                 # Run specific custom checks (e.g., hero levels, activity stats)
-                player_qualification = True
-                for check, check_kwargs in value["checks"].items():
-                    if "client" in get_func_params(CLAN_CHECKS[check]):
-                        check_kwargs["client"] = self.bot.coc
+                if not await run_clan_checks(player, value["checks"], self.bot.coc):
+                    continue
 
-                    check_result = await ipy.utils.maybe_coroutine(CLAN_CHECKS[check], player, **check_kwargs)
+                eligible_keys.append(key)
 
-                    if not check_result:
-                        player_qualification = False
-                        break
+            # Fetch clan details for display, all eligible clans at once
+            clans = await asyncio.gather(*(fetch_clan(self.bot.coc, key) for key in eligible_keys))
 
-                if not player_qualification:
-                    continue
+            # Options are collected in a plain list and wrapped in exactly one menu per account
+            account_options = []
+            # Fallback emoji for clans without a custom one, resolved once per account
+            unavailable_emoji = get_partial_emoji('unavailable')
 
-                clan_count += 1
+            for key, clan in zip(eligible_keys, clans):
+                value = clans_config[key]
 
-                # Fetch clan details for display
-                clan = await fetch_clan(self.bot.coc, key)
+                # Read every displayed field once and format the option text in one go
                 clan_league = str(clan.war_league).replace("League ", "")
+                capital_districts = clan.capital_districts
+                capital_level = capital_districts[0].hall_level if capital_districts else 0
+                full_suffix = " (Full)" if clan.member_count == 50 else ""
 
-                # 1. Default to 'unavailable' emoji if custom one is missing
-                iclan_emoji = ipy.PartialEmoji.from_str(get_app_emoji('unavailable'))
-                
-                # 2. Try to get the specific clan emoji from config
+                # Use the specific clan emoji from config if it resolves to a custom emoji (<:name:id>)
+                iclan_emoji = unavailable_emoji
                 if value["emoji"]:
-                    # Get the formatted string (<:name:id>) from cache
                     e_str = get_app_emoji(value["emoji"])
-                    
                     if "<" in e_str and ">" in e_str:
-                        iclan_emoji = ipy.PartialEmoji.from_str(e_str)
-
-                capital_level = clan.capital_districts[0].hall_level if clan.capital_districts else 0
-
-                option_label = f"{value['name']}"
-                if clan.member_count == 50:
-                    option_label += " (Full)"
+                        iclan_emoji = get_partial_emoji(value["emoji"])
 
                 # Create the selection option for this valid clan
-                clan_option = ipy.StringSelectOption(
-                    label=option_label,
-                    value=f"{key}",
+                account_options.append(ipy.StringSelectOption(
+                    label=f"{value['name']}{full_suffix}",
+                    value=key,
                     description=f"{clan_league} | Level {clan.level} | CH{capital_level} | {value['type']} | {value['requirement']}",
                     emoji=iclan_emoji
-                )
-
-                if player.tag not in clan_options.keys():
-                    clan_options[player.tag] = [clan_option]
-                    continue
+                ))
 
-                clan_options[player.tag].append(clan_option)
+            if account_options:
+                clan_options[player.tag] = account_options
 
             clan_select_id = f"clan_select|{package_token}|{count}"
 
             # If no clans are available for the player, disable the dropdown
-            if player.tag not in clan_options.keys():
+            if player.tag not in clan_options:
                 clan_select = ipy.StringSelectMenu(
-                    ipy.StringSelectOption(
-                        label="No Clans Available",
-                        value="No Clans Available",
-                        description="No Clans Available",
-                    ),
+                    NO_CLANS_OPTION,
                     placeholder=f"❌ {player.name} ({player.tag}) is not eligible",
                     custom_id=clan_select_id,
                     disabled=True
                 )
-                # Send explanatory messages to the user
-                dummy_msg = "."
-                await ctx.send(dummy_msg)
+                # Send an explanatory message in the ticket, visible to the staff as well
                 not_eligible_msg = "Sorry, at this moment you don't meet the minimum requirements to enter one of our clans. You might be either lacking Town Hall level or have rushed heroes."
                 await ctx.send(not_eligible_msg)
 
@@ -377,8 +402,9 @@ class ClanApplication(ipy.Extension):
         }
         packages[package_token] = package
 
-        with open("data/packages.json", "w") as file:
-            json.dump(packages, file, indent=4)
+        # Written in the background; bursts of applications are coalesced into one write.
+        # packages.json is machine-only state, so it is stored without indentation.
+        queue_store_json("data/packages.json", packages, indent=None)
 
         # Create Confirmation Buttons
         cancel_id = f"clan_cancel|{package_token}"
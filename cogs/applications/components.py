@@ -18,12 +18,10 @@ Dependencies:
 
 import interactions as ipy
 import re
-import json
 import secrets
-import copy
 import asyncio
+from dataclasses import dataclass
 from datetime import datetime
-from collections import Counter
 import coc
 
 # Explicit imports for internal dependencies
@@ -34,6 +32,135 @@ from core.emojis_manager import *
 from core import server_setup as sc
 from cogs.general.tickets import *
 
+# Account tag shown in a clan selection placeholder, e.g. "Name (#TAG)"
+ACCOUNT_TAG_RE = re.compile(r"\(#(\w+)\)")
+# Custom ID of the 'Apply Now' buttons, capturing the ticket type (e.g. "clan_apply_button" -> "clan")
+APPLY_BUTTON_RE = re.compile(r"^(?P<ticket>\w+)_apply_button$")
+
+# Info channel mentions used by the application embeds, with plain-text fallbacks when not configured
+APPLY_CLAN_INFO_MENTION = f"<#{CLAN_INFO_CHANNEL}>" if globals().get("CLAN_INFO_CHANNEL") else "#clan-info"
+APPLY_FWA_MENTION = f"<#{FWA_CHANNEL}>" if globals().get("FWA_CHANNEL") else "#fwa-info"
+
+@dataclass(frozen=True)
+class LayoutSpec:
+    """
+    Constants of one application embed layout created by `/embed apply`.
+
+    Attributes:
+        style (ipy.ButtonStyle): Style of the apply button.
+        emoji (ipy.PartialEmoji): Emoji of the apply button.
+        label (str): Label of the apply button.
+        title (str): Title of the embed.
+        description (str): Description template of the embed. Emojis are application emojis
+            fetched at runtime, so they are filled in when the embed is built.
+        banner (str | None): Banner image URL of the embed, if any.
+    """
+    style: ipy.ButtonStyle
+    emoji: ipy.PartialEmoji
+    label: str
+    title: str
+    description: str
+    banner: str | None
+
+def _apply_banner(layout: str) -> str | None:
+    """Returns the banner URL of a layout, falling back to BANNER_URL (if defined) when it has no specific one."""
+    return globals().get(f"{layout.upper()}_BANNER_URL", globals().get("BANNER_URL"))
+
+# Every application embed layout, keyed by the lowercase layout type
+APPLY_LAYOUTS: dict[str, LayoutSpec] = {
+    "clan": LayoutSpec(
+        style=ipy.ButtonStyle.BLURPLE,
+        emoji=ipy.PartialEmoji(name="🔰"),
+        label="Apply Now",
+        title="**All For One Clan Application**",
+        description=(
+            "{arrow} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
+            "{arrow} For the interview, you will have to answer a few short questions.\n"
+            "{arrow} After the interview, the bot will provide clans that will fit you.\n"
+            "{arrow} Lastly, we hope that you will find a new home here.\n"
+            "{arrow} For all clan details, please check {clan_info_mention}\n"
+        ),
+        banner=_apply_banner("clan"),
+    ),
+    "staff": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="👨‍💼"),
+        label="Apply Now",
+        title="**All For One Staff Application**",
+        description=(
+            "{arrow} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
+            "{arrow} For the interview, you will have to answer a few short questions.\n"
+            "{arrow} After the interview, the moderators will evaluate your responses.\n"
+            "{arrow} Lastly, we will determine whether you are eligible or not.\n"
+        ),
+        banner=_apply_banner("staff"),
+    ),
+    "fwa": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="💎"),
+        label="Apply Now",
+        title="**All For One FWA Application**",
+        description=(
+            "{diamond} If you want to join FWA in this alliance, please "
+            "press the button **\"Apply Now\"**!\n\n"
+            "Before applying for FWA make sure to have a good understanding of FWA by checking "
+            "{fwa_mention} and read the **FWA Rules and Regulations**. So that you will not "
+            "be removed from FWA for breaking the rules!"
+        ),
+        banner=_apply_banner("fwa"),
+    ),
+    "champions": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="👑"),
+        label="Apply Now",
+        title="**All For One Clan Champions Trials**",
+        description=(
+            "{arrow} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
+            "{arrow} For the interview, you will have to answer a few short questions.\n"
+            "{arrow} Before applying, we only accept th18 for champions.\n"
+            "{arrow} We also don't accept casuals in champions cwl, effort will be required.\n"
+        ),
+        banner=_apply_banner("champions"),
+    ),
+    "coaching": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="🔥"),
+        label="Apply Now",
+        title="**All For One Clan Coaching**",
+        description=(
+            "{arrow} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
+            "{arrow} For the interview, you will have to answer a few short questions.\n"
+            "{arrow} After the questions, a coach will get in contact in the ticket to set a time for the coaching to happen."
+        ),
+        banner=_apply_banner("coaching"),
+    ),
+    "support": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="🔐"),
+        label="Create Ticket",
+        title="**All For One Support**",
+        description=(
+            "{arrow} Simply press the button **\"Create Ticket\"**, then a channel will be created.\n"
+            "{arrow} Our support channel is limited to this server matters only.\n"
+            "{arrow} Open a ticket if: Bugs on any of the alliance bots, miss conduct of any members or staff, any doubts on the server or also simply being lost and not knowing where stuff is, if you would like for us to implement your idea, use suggestions channel instead."
+        ),
+        banner=_apply_banner("support"),
+    ),
+    "partner": LayoutSpec(
+        style=ipy.ButtonStyle.SECONDARY,
+        emoji=ipy.PartialEmoji(name="💼"),
+        label="Apply Now",
+        title="**All For One Partner Application**",
+        description=(
+            "{arrow} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
+            "{arrow} For the interview, you will have to answer a few short questions.\n"
+            "{arrow} After the interview, the moderators will evaluate your responses.\n"
+            "{arrow} Lastly, we will determine whether you are eligible or not.\n"
+        ),
+        banner=_apply_banner("partner"),
+    ),
+}
+
 
 class ApplicationComponents(ipy.Extension):
     """
@@ -70,8 +197,8 @@ class ApplicationComponents(ipy.Extension):
         """
         # Security: Verify that the user requesting support is the ticket owner.
         # Checks against channel topic (User ID) and channel name (Username).
-        if extract_integer(ctx.channel.topic) != int(ctx.author.id) and \
-                extract_alphabets(ctx.author.username) != ctx.channel.name.split("┃")[1]:
+        # The cached topic ID comparison runs first, so the username is only extracted when it fails.
+        if not verify_applicant(ctx):
             await ctx.send(f"{get_app_emoji('error')} Only the applicant of this channel can request support!",
                            ephemeral=True)
             return
@@ -123,15 +250,15 @@ class ApplicationComponents(ipy.Extension):
 
         message = ctx.message
         # Load current state of applications and clan configurations
-        packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
-        clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
+        packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
+        clans_config: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
 
         # Parse custom_id format: "clan_select|{token}|{index}"
-        _, package_token, fillernumber = ctx.custom_id.split("|")
+        package_token = ctx.custom_id.split("|", 2)[1]
 
         package = packages[package_token]
         acc_clan = package["acc_clan"]
-        user = await self.bot.fetch_member(package["user"], ctx.guild.id, force=True)
+        user = await self.bot.fetch_member(package["user"], ctx.guild.id)
 
         # Verify interaction ownership
         if int(user.id) != int(ctx.author.id):
@@ -140,16 +267,16 @@ class ApplicationComponents(ipy.Extension):
 
         clan_tag = ctx.values[0]
         # Extract account tag from the placeholder text (UI hacks used to persist state visually)
-        account_tag = re.search(r"\(#(\w+)\)", ctx.component.placeholder).group(1).replace(")", "")
+        account_tag = ACCOUNT_TAG_RE.search(ctx.component.placeholder).group(1)
 
         clan = await fetch_clan(self.bot.coc, clan_tag)
         player = await fetch_player(self.bot.coc, account_tag)
 
-        # Update the package with the selected clan
-        acc_clan[player.tag] = clan_tag
-
-        with open("data/packages.json", "w") as file:
-            json.dump(packages, file, indent=4)
+        # Update the package with the selected clan, writing only if the selection actually changed
+        # Writes are debounced and compact, so a quick select/cancel/reselect costs a single small write
+        if acc_clan.get(player.tag) != clan_tag:
+            acc_clan[player.tag] = clan_tag
+            queue_store_json("data/packages.json", packages, indent=None)
 
         # Update the specific dropdown to show the selection visually and lock it temporarily?
         # (Logic suggests it updates placeholder to show selection)
@@ -159,15 +286,16 @@ class ApplicationComponents(ipy.Extension):
         await message.edit(components=message.components)
 
         # Generate specific clan information message (requirements, messages, etc.)
-        clan_msg = "\n".join([msg for msg in clans_config[clan_tag]['msg'].split("|")])
-        msg_content = f"__**Key Clan Information**__ `{clan.name}`\n\n{clan_msg}\n\n"
+        clan_msg = clans_config[clan_tag]['msg'].replace("|", "\n")
     
         # Add warnings if clan is full or specific conditions apply
         if clan.member_count == 50 and clans_config[clan_tag]['type'] != "FWA":
-            msg_content += f"{get_app_emoji('warning')} *`{clan.name}` is currently full. You may still join the clan, but it will take time " \
+            clan_notice = f"{get_app_emoji('warning')} *`{clan.name}` is currently full. You may still join the clan, but it will take time " \
                         f"as the clan leader will need to make space first!*"
         else:
-            msg_content += f"📝 *In-game requests before confirming your clan selection will **not** be accepted!*"
+            clan_notice = f"📝 *In-game requests before confirming your clan selection will **not** be accepted!*"
+
+        msg_content = f"__**Key Clan Information**__ `{clan.name}`\n\n{clan_msg}\n\n{clan_notice}"
 
         clan_link_button = ipy.Button(
             style=ipy.ButtonStyle.URL,
@@ -184,31 +312,43 @@ class ApplicationComponents(ipy.Extension):
 
         # If all accounts have selections, wait for final confirmation interaction
         # or auto-confirm after timeout.
-        perm_ctx = PermanentContext(ctx.message, ctx.custom_id, ctx.channel, ctx.guild, ctx.deferred, ctx.author,
-                                    ctx.kwargs)
+        # The applicant's ID is resolved once, the check runs for every component event on the message
+        author_id = ctx.author.id
 
         async def check(event: ipy.events.Component):
-            if int(event.ctx.author.id) == int(ctx.author.id):
+            if event.ctx.author.id == author_id:
                 return True
             await event.ctx.send(f"{get_app_emoji('error')} You cannot interact with other user's components.", ephemeral=True)
             return False
 
-        # Timeout logic for auto-confirmation suggestion
+        # A single waiter covers the whole 10 minute window: the reminder is sent after 5 minutes,
+        # and the remaining time is measured from the same deadline so sending it doesn't extend the wait.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + 600
+        waiter = asyncio.ensure_future(self.bot.wait_for_component(messages=ctx.message, check=check))
+
         try:
-            await self.bot.wait_for_component(messages=ctx.message, check=check, timeout=300)
-        except asyncio.TimeoutError:
+            # Timeout logic for auto-confirmation suggestion
+            done, _ = await asyncio.wait([waiter], timeout=300)
+            if done:
+                # Re-raise anything the waiter failed with instead of dropping it
+                waiter.result()
+                return
+
             await ctx.send(
                 f"{ctx.author.mention} Please confirm your selection, or the bot will **automatically confirm** for you "
                 f"due inactivity in 5 more minutes. You may also cancel your current selection and reselect.",
                 ephemeral=True)
-        else:
-            return
 
-        # Second timeout forces auto-confirmation
-        try:
-            await self.bot.wait_for_component(messages=ctx.message, check=check, timeout=300)
-        except asyncio.TimeoutError:
-            await self.clan_confirm(ctx)
+            # Second timeout forces auto-confirmation
+            done, _ = await asyncio.wait([waiter], timeout=max(deadline - loop.time(), 0))
+            if done:
+                waiter.result()
+                return
+        finally:
+            waiter.cancel()
+
+        await self.clan_confirm(ctx)
     
     @ipy.component_callback(re.compile(r"^clan_confirm\|\w+$"))
     async def clan_confirm(self, ctx: ipy.ComponentContext | PermanentContext):
@@ -227,13 +367,13 @@ class ApplicationComponents(ipy.Extension):
         await ctx.defer(ephemeral=True) if not ctx.deferred else None
         
         message = ctx.message
-        package_token = ctx.custom_id.split("|")[1]
-        packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
-        clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
+        package_token = ctx.custom_id.partition("|")[2]
+        packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
+        clans_config: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
     
         package = packages[package_token]
         acc_clan = package["acc_clan"]
-        user = await self.bot.fetch_member(package["user"], ctx.guild.id, force=True)
+        user = await self.bot.fetch_member(package["user"], ctx.guild.id)
 
         if int(user.id) != int(ctx.author.id):
             await ctx.send(f"{get_app_emoji('error')} You **cannot** interact with other user's components.", ephemeral=True)
@@ -263,46 +403,58 @@ class ApplicationComponents(ipy.Extension):
     
         player_options = []
         role_mentions = []
+        recruiter_ids = set()
         townhall_emoji = None
         player = None
         
         config: sc.GuildConfig = sc.get_config(ctx.guild.id)
         recruitment_role_id = config.RECRUITMENT_ROLE
 
-        # Iterate through selections to build the summary and calculate mentions
-        for count, (acc, clan) in enumerate(acc_clan.items(), start=1):
-            if not clan:
-                continue
+        # Fetch every selected account and its clan at once; numbering still counts unselected accounts
+        # Accounts applying to the same clan share a single fetch of that clan
+        selections = [(count, acc, clan) for count, (acc, clan) in enumerate(acc_clan.items(), start=1) if clan]
+        selected_clan_tags = list(dict.fromkeys(clan for _, _, clan in selections))
+        players, fetched_clans = await asyncio.gather(
+            asyncio.gather(*(fetch_player(self.bot.coc, acc) for _, acc, _ in selections)),
+            asyncio.gather(*(fetch_clan(self.bot.coc, clan) for clan in selected_clan_tags))
+        )
+        clans_by_tag = dict(zip(selected_clan_tags, fetched_clans))
+        clans = [clans_by_tag[clan] for _, _, clan in selections]
 
-            player = await fetch_player(self.bot.coc, acc)
-            clan = await fetch_clan(self.bot.coc, clan)
+        # Emojis shared by every summary field are resolved once
+        unavailable_emoji = get_app_emoji('unavailable')
+        reply_emoji = get_app_emoji('reply')
 
-            # Determine which roles to ping based on the selected clan's config
-            if f"<@&{clans_config[clan.tag]['role']}>" not in role_mentions:
-                role_mentions.append(f"<@&{clans_config[clan.tag]['gk_role']}>") # 'gk_role' likely stands for Gatekeeper/Recruiter
+        # Iterate through selections to build the summary and calculate mentions
+        for (count, _, _), player, clan in zip(selections, players, clans):
 
-                # Grant permission to the specific clan's recruiters to see this ticket
-                clan_role = await ctx.guild.fetch_role(clans_config[clan.tag]['gk_role'])
+            # Determine which roles to ping based on the selected clan's config
+            # Each recruiter role is handled once, even if several accounts picked clans sharing it
+            gk_role_id = clans_config[clan.tag]['gk_role'] # 'gk_role' likely stands for Gatekeeper/Recruiter
+            gk_role_mention = f"<@&{gk_role_id}>"
+            if gk_role_mention not in role_mentions:
+                role_mentions.append(gk_role_mention)
+
+                # Collect the specific clan's recruiters, who are granted access to this ticket below
+                # The role is almost always in the guild cache, only fall back to a REST fetch when it isn't
+                clan_role = ctx.guild.get_role(gk_role_id) or await ctx.guild.fetch_role(gk_role_id)
                 for member in clan_role.members:
-                    member_roles = [int(role.id) for role in member.roles]
-                    if recruitment_role_id not in member_roles:
-                        continue
-                    await ctx.channel.add_permission(
-                        target=member.id, type=ipy.OverwriteType.MEMBER,
-                        allow=ipy.Permissions.VIEW_CHANNEL | ipy.Permissions.SEND_MESSAGES
-                    )
+                    if any(int(role.id) == recruitment_role_id for role in member.roles):
+                        recruiter_ids.add(int(member.id))
 
-            townhall_emoji = ipy.PartialEmoji.from_str(get_app_emoji(f"Townhall{player.town_hall}"))
+            # The Town Hall emoji is looked up once and reused for the summary and the profile option
+            townhall_emoji_str = get_app_emoji(f"Townhall{player.town_hall}")
+            townhall_emoji = get_townhall_emoji(player.town_hall)
 
             # Retrieve custom emoji for the clan if available
-            clan_emoji = get_app_emoji('unavailable')
+            clan_emoji = unavailable_emoji
             clan_emoji_name = clans_config[clan.tag]['emoji']
             fetched_emoji = get_app_emoji(clan_emoji_name)
             if ":" in fetched_emoji: 
                 clan_emoji = fetched_emoji
 
-            player_summary = f"{get_app_emoji(f'Townhall{player.town_hall}')}[{player.name} ({player.tag})]({player.share_link})\n" \
-                            f"{get_app_emoji('reply')} {clan_emoji}[{clan.name} ({clan.tag})]({clan.share_link})\n"
+            player_summary = f"{townhall_emoji_str}[{player.name} ({player.tag})]({player.share_link})\n" \
+                            f"{reply_emoji} {clan_emoji}[{clan.name} ({clan.tag})]({clan.share_link})\n"
 
             embed.add_field(
                 name=f"Applicant Account #{count}",
@@ -322,6 +474,14 @@ class ApplicationComponents(ipy.Extension):
             )
             player_options.append(player_option)
         
+        # Grant every collected recruiter permission to see this ticket, one request per member at once
+        await asyncio.gather(*(
+            ctx.channel.add_permission(
+                target=member_id, type=ipy.OverwriteType.MEMBER,
+                allow=ipy.Permissions.VIEW_CHANNEL | ipy.Permissions.SEND_MESSAGES
+            ) for member_id in recruiter_ids
+        ))
+
         # Prepare components for the final message (Link to ClashOfStats or Dropdown)
         formatted_tag2 = player.tag.lstrip("#") 
         player_info = ipy.Button(
@@ -347,28 +507,21 @@ class ApplicationComponents(ipy.Extension):
             components=ipy.spread_to_rows(*components) if isinstance(player_info, ipy.StringSelectMenu) else [
                 ipy.ActionRow(*components)]
         )
-        await ctx.channel.send(LINE_URL)
-
-        # Attempt to rename the channel with the clan's prefix
-        try:
-            # Use the prefix of the first selected clan
-            clan_prefix = clans_config[list(acc_clan.values())[0]]['prefix'].translate(PREFIX_DICT)
-            parent_id = config.CLAN_TICKETS_CATEGORY if int(
-                ctx.channel.category.id) == config.FWA_TICKETS_CATEGORY else ctx.channel.category.id
-            await ctx.channel.edit(name=f"{clan_prefix}┃{user.user.username}", parent_id=parent_id)
-        except (ipy.errors.DiscordError, ipy.errors.RateLimited, ipy.errors.Forbidden):
-            # Ignore errors if bot lacks permission or is rate limited
-            pass
 
+        # The closing divider, the ticket rename and the applicant's confirmation don't depend on each other,
+        # so they are sent together; the divider still lands right after the summary.
+        follow_ups = [ctx.channel.send(LINE_URL), self._rename_ticket(ctx, clans_config, acc_clan, user, config)]
         if isinstance(ctx, ipy.ComponentContext):
-            await ctx.send(
+            follow_ups.append(ctx.send(
                 f"{get_app_emoji('success')} **Thank you** for applying, please wait patiently for the clan leaders!",
                 ephemeral=True, delete_after=4
-            )
+            ))
+        await asyncio.gather(*follow_ups)
 
         # Post welcome messages/questions specific to the selected clans
-        unique_clan_tags = list(set([clan for clan in acc_clan.values() if clan]))
-        questions_content = ""
+        # Deduplicated in selection order, so the welcome messages follow the order of the accounts
+        unique_clan_tags = list(dict.fromkeys(clan for clan in acc_clan.values() if clan))
+        welcome_parts = []
         for tag in unique_clan_tags:
             if tag not in clans_config:
                 continue
@@ -384,10 +537,35 @@ class ApplicationComponents(ipy.Extension):
             
             if q_list:
                 formatted_questions = "\n".join(q_list)
-                questions_content += f"**Welcome to {clan_name}**\n{formatted_questions}\n\n"
+                welcome_parts.append(f"**Welcome to {clan_name}**\n{formatted_questions}")
+
+        if welcome_parts:
+            await ctx.channel.send("\n\n".join(welcome_parts))
 
-        if questions_content:
-            await ctx.channel.send(questions_content)
+    @staticmethod
+    async def _rename_ticket(ctx: ipy.ComponentContext | PermanentContext, clans_config: dict[str, AllianceClanData],
+                             acc_clan: dict[str, str | None], user: ipy.Member, config: sc.GuildConfig):
+        """
+        Renames a confirmed clan ticket with the first selected clan's prefix.
+        Tickets in the FWA category are moved to the clan tickets category.
+
+        Args:
+            ctx (ipy.ComponentContext | PermanentContext): Context of the confirmation.
+            clans_config (dict[str, AllianceClanData]): The loaded clan configuration.
+            acc_clan (dict[str, str | None]): The package's account to clan selections.
+            user (ipy.Member): The applicant.
+            config (sc.GuildConfig): The guild's configuration.
+        """
+        # Attempt to rename the channel with the clan's prefix
+        try:
+            # Use the prefix of the first selected clan
+            clan_prefix = clans_config[list(acc_clan.values())[0]]['prefix'].translate(PREFIX_DICT)
+            parent_id = config.CLAN_TICKETS_CATEGORY if int(
+                ctx.channel.category.id) == config.FWA_TICKETS_CATEGORY else ctx.channel.category.id
+            await ctx.channel.edit(name=f"{clan_prefix}┃{user.user.username}", parent_id=parent_id)
+        except (ipy.errors.DiscordError, ipy.errors.RateLimited, ipy.errors.Forbidden):
+            # Ignore errors if bot lacks permission or is rate limited
+            pass
 
     @ipy.component_callback(re.compile(r"^clan_cancel\|\w+$"))
     async def clan_cancel(self, ctx: ipy.ComponentContext):
@@ -400,15 +578,17 @@ class ApplicationComponents(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): Context of the cancel interaction.
         """
-        packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
-        package_token = ctx.custom_id.split("|")[1]
+        packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
+        package_token = ctx.custom_id.partition("|")[2]
         package = packages[package_token]
-        user = await self.bot.fetch_member(package["user"], ctx.guild.id, force=True)
+        user = await self.bot.fetch_member(package["user"], ctx.guild.id)
 
         if int(user.id) != int(ctx.author.id):
             await ctx.send(f"{get_app_emoji('error')} You **cannot** interact with other user's components.", ephemeral=True)
             return
 
+        selections_cleared = False
+
         # Iterate through components to reset them
         for count, action_row in enumerate(ctx.message.components):
             for component in action_row.components:
@@ -421,10 +601,12 @@ class ApplicationComponents(ipy.Extension):
                     component.placeholder = f"{NUMBER_EMOJIS[count + 1]} Select a clan for {player.name} ({player.tag})"
 
                     # Clear the selection in the backend package
-                    package["acc_clan"][player_tag] = None
+                    if package["acc_clan"].get(player_tag) is not None:
+                        package["acc_clan"][player_tag] = None
+                        selections_cleared = True
 
-        with open("data/packages.json", "w") as file:
-            json.dump(packages, file, indent=4)
+        if selections_cleared:
+            queue_store_json("data/packages.json", packages, indent=None)
 
         await ctx.message.edit(components=ctx.message.components)
         await ctx.send(f"{get_app_emoji('success')} Your previous clan selections has been **canceled**, please reselect now!",
@@ -461,64 +643,64 @@ class ApplicationComponents(ipy.Extension):
             await ctx.send(f"{get_app_emoji('error')} Not a single valid player tag is provided!")
             return
 
-        # Ensure emojis are up to date
-        await fetch_emojis(self.bot, update=True)
+        # Ensure emojis are up to date, reusing a recent fetch instead of calling the API every time
+        await fetch_emojis(self.bot, update=True, max_age=EMOJI_REFRESH_INTERVAL)
 
-        clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
+        clans_config: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
         package_token = secrets.token_hex(8)
-        normal_clans = [i for i in list(clans_config.keys())]
+        # Static filters (recruitment, type, TH range) are evaluated once per invocation, not once per account
+        eligible_clans = []
+        for key, value in clans_config.items():
+            if not value["recruitment"] or value["type"] == "FWA":
+                continue
+            max_th_str = value.get("maximum_possibleTH")
+            eligible_clans.append((
+                key, value, extract_integer(value['requirement']),
+                extract_integer(max_th_str) if max_th_str else None
+            ))
 
         clan_options = {}
         clan_actionrows = []
         acc_clan = {}
         acc_images = {}
         
-        # Generate dropdown options for each provided account tag
-        for count, account in enumerate(account_tags, start=1):
-            if not account: continue
+        # Fetch every provided account at once, then generate dropdown options for each of them
+        account_tags = [account for account in account_tags if account]
+        players = await asyncio.gather(*(fetch_player(self.bot.coc, account) for account in account_tags))
 
-            player = await fetch_player(self.bot.coc, account)
-            clan_count = 0
+        for count, (account, player) in enumerate(zip(account_tags, players), start=1):
+            eligible_keys = []
             acc_clan[account] = None
             acc_images[account] = None
             
             # Filter clans based on requirements (TH level, hero levels via checks)
-            for key in normal_clans:
-                try: value = clans_config[key]
-                except KeyError: continue
-                if clan_count >= 30: break
-                if not value["recruitment"]: continue
-                if value["type"] == "FWA": continue
-
-                player_qualification = True
-                if extract_integer(value['requirement']) > player.town_hall: continue
-                max_th_str = value.get("maximum_possibleTH")
-                if max_th_str and player.town_hall > extract_integer(max_th_str): continue
-
-                for check, check_kwargs in value["checks"].items():
-                    if "client" in get_func_params(CLAN_CHECKS[check]):
-                        check_kwargs["client"] = self.bot.coc
-                    check_result = await ipy.utils.maybe_coroutine(CLAN_CHECKS[check], player, **check_kwargs)
-                    if not check_result:
-                        player_qualification = False
-                        break
-
-                if not player_qualification: continue
-
-                clan_count += 1
-                clan = await fetch_clan(self.bot.coc, key)
+            for key, value, min_th, max_th in eligible_clans:
+                if len(eligible_keys) >= 30: break
+                if min_th > player.town_hall: continue
+                if max_th and player.town_hall > max_th: continue
+
+                # Custom checks (e.g. hero levels) never mutate the shared config kwargs
+                if not await run_clan_checks(player, value["checks"], self.bot.coc): continue
+
+                eligible_keys.append(key)
+
+            # Fetch the details of all qualified clans at once
+            clans = await asyncio.gather(*(fetch_clan(self.bot.coc, key) for key in eligible_keys))
+
+            for key, clan in zip(eligible_keys, clans):
+                value = clans_config[key]
                 clan_league = str(clan.war_league).replace("League ", "")
 
                 # Set up emojis
-                iclan_emoji = ipy.PartialEmoji.from_str(get_app_emoji('unavailable'))
+                iclan_emoji = get_partial_emoji('unavailable')
                 if value["emoji"]:
                     emoji_str = get_app_emoji(value["emoji"])
                     if "<" in emoji_str and ">" in emoji_str:
-                        iclan_emoji = ipy.PartialEmoji.from_str(emoji_str)
+                        iclan_emoji = get_partial_emoji(value["emoji"])
 
                 capital_level = clan.capital_districts[0].hall_level if clan.capital_districts else 0
-                option_label = f"{value['name']} (ER)" if player_qualification == "ER" else value['name']
-                if "(ER)" not in option_label and clan.member_count == 50:
+                option_label = value['name']
+                if clan.member_count == 50:
                     option_label += " (Full)"
 
                 clan_option = ipy.StringSelectOption(
@@ -537,7 +719,7 @@ class ApplicationComponents(ipy.Extension):
 
             if player.tag not in clan_options.keys():
                 clan_select = ipy.StringSelectMenu(
-                    ipy.StringSelectOption(label="No Clans Available", value="No Clans Available", description="No Clans Available"),
+                    NO_CLANS_OPTION,
                     placeholder=f"❌ {player.name} ({player.tag}) is not eligible",
                     custom_id=clan_select_id,
                     disabled=True
@@ -552,7 +734,7 @@ class ApplicationComponents(ipy.Extension):
             clan_actionrow = ipy.ActionRow(clan_select)
             clan_actionrows.append(clan_actionrow)
 
-        packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
+        packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
         cancel_id = f"clan_cancel|{package_token}"
         cancel_button = ipy.Button(style=ipy.ButtonStyle.DANGER, label="Cancel", custom_id=cancel_id, emoji=get_app_emoji('cross'))
         confirm_id = f"clan_confirm|{package_token}"
@@ -580,8 +762,7 @@ class ApplicationComponents(ipy.Extension):
         }
         packages[package_token] = package
 
-        with open("data/packages.json", "w") as file:
-            json.dump(packages, file, indent=4)
+        queue_store_json("data/packages.json", packages, indent=None)
 
     @ipy.global_autocomplete(option_name="player_tag1")
     async def player_tag1_autocomplete(self, ctx: ipy.AutocompleteContext):
@@ -594,24 +775,35 @@ class ApplicationComponents(ipy.Extension):
             await ctx.send(tag_choice)
             return
 
-        player_links = json.load(open("data/member_tags.json", "r"))
+        player_links = await fetch_json("data/member_tags.json")
         if not player_links.get(ctx.kwargs["user"]):
             tag_choice = [{"name": "No accounts linked to this player", "value": "None"}]
             await ctx.send(tag_choice)
             return
 
+        # Verify every linked tag concurrently; the list of tags is plain strings, so a shallow copy is enough
+        linked_tags = list(player_links[ctx.kwargs["user"]])
+        linked_players = await asyncio.gather(
+            *(fetch_player(self.bot.coc, tag) for tag in linked_tags), return_exceptions=True
+        )
+
         tag_choices = []
-        for tag in copy.deepcopy(player_links[ctx.kwargs["user"]]):
-            try: player = await fetch_player(self.bot.coc, tag)
-            except coc.errors.NotFound:
-                player_links[ctx.kwargs["user"]].remove(tag)
+        valid_tags = []
+        for tag, player in zip(linked_tags, linked_players):
+            if isinstance(player, coc.errors.NotFound):
                 continue
+            if isinstance(player, BaseException):
+                raise player
+            valid_tags.append(tag)
             name = f"[TH{player.town_hall}] {player.name} ({player.tag})"
             tag_choices.append({"name": name, "value": tag})
 
         await ctx.send(tag_choices)
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+
+        # Invalid tags are removed from the links, which are only written back when that happened
+        if len(valid_tags) != len(linked_tags):
+            player_links[ctx.kwargs["user"]] = valid_tags
+            await store_json("data/member_tags.json", player_links)
 
 
 class EmbedCommands(ipy.Extension):
@@ -689,29 +881,32 @@ class EmbedCommands(ipy.Extension):
         """
         await ctx.defer(ephemeral=True)
 
-        data = CLAN_TYPE_DATA[ctx.custom_id.split("_")[0]]
-        alliance_clans: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
-        normal_clans = list(alliance_clans.keys())
+        data = CLAN_TYPE_DATA[ctx.custom_id.partition("_")[0]]
+        alliance_clans: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
+        # Find the clans matching the selected type first (no I/O), then fetch all of them at once
+        clan_type = data.lower()
+        matching_keys = [key for key, value in alliance_clans.items() if value["type"].lower() == clan_type]
 
-        await fetch_emojis(self.bot, update=True)
+        # Emojis are refreshed at most every EMOJI_REFRESH_INTERVAL seconds
+        await fetch_emojis(self.bot, update=True, max_age=EMOJI_REFRESH_INTERVAL)
+
+        clans = await asyncio.gather(*(fetch_clan(self.bot.coc, key) for key in matching_keys))
 
         clan_embed = None
         clan_options = []
         
-        # Iterate through clans to find matches for the selected type
-        for key in normal_clans:
-            try: value = alliance_clans[key]
-            except KeyError: continue
-            if value["type"].lower() != data.lower(): continue
-
-            clan = await fetch_clan(self.bot.coc, key)
+        # Iterate through the matching clans in config order
+        for key, clan in zip(matching_keys, clans):
+            value = alliance_clans[key]
             
             # Generate the default preview embed (using the first match found)
             if not clan_embed:
                 league_emoji = get_app_emoji(str(clan.war_league).replace("League ", ""))
                 clan_description = clan.description if clan.description else "There is no clan description, it seems that the leader is too lazy..."
-                clan_townhalls = [member.town_hall for member in clan.members]
-                clan_compo = dict(Counter(clan_townhalls))
+                # Count members per Town Hall level in a single pass
+                clan_compo = {}
+                for member in clan.members:
+                    clan_compo[member.town_hall] = clan_compo.get(member.town_hall, 0) + 1
                 clan_compo_text = " | ".join(f"{num}{get_app_emoji(f'Townhall{th}')}" for th, num in clan_compo.items())
 
                 clan_embed = ipy.Embed(
@@ -737,7 +932,7 @@ class EmbedCommands(ipy.Extension):
             iclan_emoji = ipy.PartialEmoji(name="Unavailable", id=1318284335580975125)
             emoji_str = get_app_emoji(value["emoji"])
             if "<" in emoji_str and ">" in emoji_str:
-                iclan_emoji = ipy.PartialEmoji.from_str(emoji_str)
+                iclan_emoji = get_partial_emoji(value["emoji"])
 
             clan_league = str(clan.war_league).replace("League ", "")
             capital_level = clan.capital_districts[0].hall_level if clan.capital_districts else 0
@@ -768,14 +963,16 @@ class EmbedCommands(ipy.Extension):
         Callback for the Live Clan Dropdown.
         Updates the embed to show details for the specific clan selected from the dropdown.
         """
-        alliance_clans: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
+        alliance_clans: dict[str, AllianceClanData] = await fetch_json("data/clans_config.json")
         clan = await fetch_clan(self.bot.coc, ctx.values[0])
 
         clan_dict = alliance_clans[clan.tag]
         league_emoji = get_app_emoji(str(clan.war_league).replace("League ", ""))
         clan_description = clan.description if clan.description else "There is no clan description, it seems that the leader is too lazy..."
-        clan_townhalls = [member.town_hall for member in clan.members]
-        clan_compo = dict(Counter(clan_townhalls))
+        # Count members per Town Hall level in a single pass
+        clan_compo = {}
+        for member in clan.members:
+            clan_compo[member.town_hall] = clan_compo.get(member.town_hall, 0) + 1
         clan_compo_text = " | ".join(f"{num}{get_app_emoji(f'Townhall{th}')}" for th, num in clan_compo.items())
 
         clan_embed = ipy.Embed(
@@ -821,124 +1018,29 @@ class EmbedCommands(ipy.Extension):
             ctx (ipy.SlashContext): The slash command context.
             layout_type (str): The specific type of application panel to generate.
         """
-        style = ipy.ButtonStyle.SECONDARY
-        arrow_emoji = get_app_emoji('arrow')
-        diamond_emoji = get_app_emoji('diamond')
-        
-        # Safely fetch Banner URL (defaults to BANNER_URL if specific one missing)
-        banner = globals().get('BANNER_URL') # Fallback default
-        
-        # Safely fetch channels
-        clan_info_id = globals().get('CLAN_INFO_CHANNEL', 0)
-        clan_info_mention = f"<#{clan_info_id}>" if clan_info_id else "#clan-info"
-        fwa_id = globals().get('FWA_CHANNEL', 0)
-        fwa_mention = f"<#{fwa_id}>" if fwa_id else "#fwa-info"
-        
-        # Logic to customize embed content based on layout_type
-        if layout_type.lower() == "clan":
-            apply_emoji = ipy.PartialEmoji(name="🔰")
-            style = ipy.ButtonStyle.BLURPLE
-            if 'CLAN_BANNER_URL' in globals(): banner = CLAN_BANNER_URL
-            
-            embed = ipy.Embed(
-                title=f"**All For One Clan Application**",
-                description=f"{arrow_emoji} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
-                            f"{arrow_emoji} For the interview, you will have to answer a few short questions.\n"
-                            f"{arrow_emoji} After the interview, the bot will provide clans that will fit you.\n"
-                            f"{arrow_emoji} Lastly, we hope that you will find a new home here.\n"
-                            f"{arrow_emoji} For all clan details, please check {clan_info_mention}\n",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )
-        elif layout_type.lower() == "staff":
-            apply_emoji = ipy.PartialEmoji(name="👨‍💼")
-            if 'STAFF_BANNER_URL' in globals(): banner = STAFF_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One Staff Application**",
-                description=f"{arrow_emoji} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
-                            f"{arrow_emoji} For the interview, you will have to answer a few short questions.\n"
-                            f"{arrow_emoji} After the interview, the moderators will evaluate your responses.\n"
-                            f"{arrow_emoji} Lastly, we will determine whether you are eligible or not.\n",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )
-        elif layout_type.lower() == "fwa":
-            apply_emoji = ipy.PartialEmoji(name="💎")
-            if 'FWA_BANNER_URL' in globals(): banner = FWA_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One FWA Application**",
-                description=f"{diamond_emoji} If you want to join FWA in this alliance, please "
-                            f"press the button **\"Apply Now\"**!\n\n"
-                            f"Before applying for FWA make sure to have a good understanding of FWA by checking "
-                            f"{fwa_mention} and read the **FWA Rules and Regulations**. So that you will not "
-                            f"be removed from FWA for breaking the rules!",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )
-        elif layout_type.lower()== "champions":
-            apply_emoji = ipy.PartialEmoji(name="👑")
-            if 'CHAMPIONS_BANNER_URL' in globals(): banner = CHAMPIONS_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One Clan Champions Trials**",
-                description=f"{arrow_emoji} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
-                            f"{arrow_emoji} For the interview, you will have to answer a few short questions.\n"
-                            f"{arrow_emoji} Before applying, we only accept th18 for champions.\n"
-                            f"{arrow_emoji} We also don't accept casuals in champions cwl, effort will be required.\n",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )
-        elif layout_type.lower()== "coaching":
-            apply_emoji = ipy.PartialEmoji(name="🔥")
-            if 'COACHING_BANNER_URL' in globals(): banner = COACHING_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One Clan Coaching**",
-                description=f"{arrow_emoji} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
-                            f"{arrow_emoji} For the interview, you will have to answer a few short questions.\n"
-                            f"{arrow_emoji} After the questions, a coach will get in contact in the ticket to set a time for the coaching to happen.",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            ) 
-        elif layout_type.lower()=="support":
-            apply_emoji = ipy.PartialEmoji(name="🔐")
-            if 'SUPPORT_BANNER_URL' in globals(): banner = SUPPORT_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One Support**",
-                description=f"{arrow_emoji} Simply press the button **\"Create Ticket\"**, then a channel will be created.\n"
-                            f"{arrow_emoji} Our support channel is limited to this server matters only.\n"
-                            f"{arrow_emoji} Open a ticket if: Bugs on any of the alliance bots, miss conduct of any members or staff, any doubts on the server or also simply being lost and not knowing where stuff is, if you would like for us to implement your idea, use suggestions channel instead.",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )      
-        elif layout_type.lower() == "partner":
-            apply_emoji = ipy.PartialEmoji(name="💼")
-            if 'PARTNER_BANNER_URL' in globals(): banner = PARTNER_BANNER_URL
-
-            embed = ipy.Embed(
-                title=f"**All For One Partner Application**",
-                description=f"{arrow_emoji} Simply press the button **\"Apply Now\"**, then a channel will be created for an interview.\n"
-                            f"{arrow_emoji} For the interview, you will have to answer a few short questions.\n"
-                            f"{arrow_emoji} After the interview, the moderators will evaluate your responses.\n"
-                            f"{arrow_emoji} Lastly, we will determine whether you are eligible or not.\n",
-                images=[ipy.EmbedAttachment(url=banner)] if banner else [],
-                color=COLOR
-            )          
-        
+        # Every per-layout constant comes from a single table lookup
+        layout = layout_type.lower()
+        spec = APPLY_LAYOUTS[layout]
+
+        embed = ipy.Embed(
+            title=spec.title,
+            description=spec.description.format_map({
+                "arrow": get_app_emoji('arrow'), "diamond": get_app_emoji('diamond'),
+                "clan_info_mention": APPLY_CLAN_INFO_MENTION, "fwa_mention": APPLY_FWA_MENTION
+            }),
+            images=[ipy.EmbedAttachment(url=spec.banner)] if spec.banner else [],
+            color=COLOR
+        )
         embed.set_footer(text="Feel free to message in visitor-chat for any confusions!")
-        
-        label_text = "Create Ticket" if layout_type.lower() == "support" else "Apply Now"
+
         apply_button = ipy.Button(
-            style=style, label=label_text, custom_id=f"{layout_type.lower()}_apply_button", emoji=apply_emoji
-        )   
+            style=spec.style, label=spec.label, custom_id=f"{layout}_apply_button", emoji=spec.emoji
+        )
 
         await ctx.channel.send(embeds=[embed], components=apply_button)
         await ctx.send(f"{get_app_emoji('success')} {layout_type} application embed is created!", ephemeral=True)
 
-    @ipy.component_callback(re.compile(r"^\w+_apply_button$"))
+    @ipy.component_callback(APPLY_BUTTON_RE)
     async def apply_buttons(self, ctx: ipy.ComponentContext):
         """
         Generic callback for all 'Apply Now' buttons generated by 'embed_apply'.
@@ -952,7 +1054,7 @@ class EmbedCommands(ipy.Extension):
         await ctx.defer(ephemeral=True)
         member = ctx.author
         # Extract ticket type from custom_id (e.g., "clan_apply_button" -> "clan")
-        ticket_type = ctx.custom_id.split('_')[0]
+        ticket_type = APPLY_BUTTON_RE.match(ctx.custom_id)["ticket"]
         
         # Delegate ticket creation to the TicketManager
         channel = await TicketManager.create_ticket(ctx, member, ticket_type, self.bot)
@@ -22,8 +22,6 @@ from datetime import datetime
 import asyncio
 import validators
 import secrets
-import json
-import copy
 import coc
 
 # Explicit imports for cleaner namespace management
@@ -32,6 +30,36 @@ from core.utils import *
 # Note: core.models was imported twice in the original; kept one.
 from core import server_setup as sc
 
+# Options of the "number of accounts" select menu, shared by every interview
+ACCOUNT_COUNT_OPTIONS = (
+    ipy.StringSelectOption(label="1", value="1"),
+    ipy.StringSelectOption(label="2", value="2"),
+)
+
+# Descriptions of the interview steps; {jump_url} links to the ticket's welcome message
+ACCOUNT_COUNT_DESCRIPTION = (
+    "- Choose the number of accounts you will be applying with using the select menu.\n"
+    "- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help."
+)
+TAG_REQUEST_DESCRIPTION = (
+    "- Post the tag of your Clash of Clans account in the chat.\n"
+    "- Example answer: `#LCCYJVRUY` (can be copied from your profile)\n"
+    "- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help."
+)
+SCREENSHOT_REQUEST_DESCRIPTION = (
+    "- Please upload the screenshot as an attachment or send it as image URL.\n"
+    "- This section is **compulsory**, and the base must be FWA base currently activated in your war base!\n"
+    "- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help."
+)
+
+# Button to help users find FWA base layouts, attached to every screenshot request
+FWA_BASE_BUTTON = ipy.Button(
+    style=ipy.ButtonStyle.LINK,
+    label="Get FWA Base",
+    url="https://discord.com/channels/1167707509813940245/1336857708996988938",
+    emoji=ipy.PartialEmoji(name="🔨")
+)
+
 class FwaApplication(ipy.Extension):
     """
     Manages the interactive components and logic for the FWA Clan Application system.
@@ -63,13 +91,14 @@ class FwaApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
+        # The error emoji is resolved once and shared by every rejection/retry message of this interview
+        error_emoji = get_app_emoji('error')
 
         # Identity Verification:
         # Ensure that the user clicking the button is the owner of the ticket.
-        if extract_integer(ctx.channel.topic) != int(member.id) and \
-                extract_alphabets(member.username) != ctx.channel.name.split("┃")[1]:
-            await ctx.send(f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
+        # The cached topic ID comparison runs first, so the username is only extracted when it fails.
+        if not verify_applicant(ctx):
+            await ctx.send(f"{error_emoji} Only the applicant of this channel can start the interview!",
                            ephemeral=True)
             return
 
@@ -81,7 +110,7 @@ class FwaApplication(ipy.Extension):
             """Ensure only the applicant interacts with the components."""
             if int(event.ctx.author.id) == int(ctx.author.id):
                 return True
-            await event.ctx.send(f"{get_app_emoji('error')} You cannot interact with other user's components.", ephemeral=True)
+            await event.ctx.send(f"{error_emoji} You cannot interact with other user's components.", ephemeral=True)
             return False
 
         async def msg_check(event: ipy.events.MessageCreate):
@@ -95,25 +124,29 @@ class FwaApplication(ipy.Extension):
 
         # --- Step 1: Account Quantity Selection ---
         acc_images = {}
-        account_tags = []
+        # Accounts provided during the interview, keyed by tag so duplicates collapse in entry order.
+        # The player objects are reused for the summary instead of fetching again.
+        accounts: dict[str, coc.Player] = {}
         jump_url = ctx.message.jump_url if ctx.message else ""
+        # Only the jump URL varies between interviews, so the step descriptions are filled in once here
+        interview_vars = {"jump_url": jump_url}
+        tag_request_description = TAG_REQUEST_DESCRIPTION.format_map(interview_vars)
+        screenshot_request_description = SCREENSHOT_REQUEST_DESCRIPTION.format_map(interview_vars)
+        # Retry prompts are built once per interview rather than on every invalid response
+        invalid_tag_message = INVALID_TAG_MESSAGE.format(error=error_emoji)
+        image_required_message = IMAGE_REQUIRED_MESSAGE.format(error=error_emoji)
 
         embed = ipy.Embed(
             title=f"**With how many account do you want to apply?**",
-            description=f"- Choose the number of accounts you will be applying with using the select menu.\n"
-                        f"- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help.",
+            description=ACCOUNT_COUNT_DESCRIPTION.format_map(interview_vars),
             footer=ipy.EmbedFooter(
                 text="Feel free to ask for help for any confusions."
             ),
             color=COLOR
         )
 
-        account_options = [
-            ipy.StringSelectOption(label="1", value="1"),
-            ipy.StringSelectOption(label="2", value="2"),
-        ]
         account_select = ipy.StringSelectMenu(
-            *account_options,
+            *ACCOUNT_COUNT_OPTIONS,
             placeholder="#️⃣ Select number of accounts here",
             custom_id="account_select"
         )
@@ -129,31 +162,37 @@ class FwaApplication(ipy.Extension):
                 raise ComponentTimeoutError(message=msg)
             break
 
-        # Lock the selection UI
-        account_select = ipy.StringSelectMenu(
-            *account_options,
-            placeholder=f"✅ {res.values[0]} account(s) is/are selected",
-            disabled=True,
-            custom_id="account_select"
-        )
+        # Lock the selection UI (the menu is updated in place rather than rebuilt)
+        account_select.placeholder = f"✅ {res.values[0]} account(s) is/are selected"
+        account_select.disabled = True
         await res.edit_origin(components=[account_select])
 
         # --- Pre-fetch Linked Accounts for Convenience ---
-        player_links = json.load(open("data/member_tags.json", "r"))
+        # The shared links data is only read here; tags that no longer exist are collected
+        # and removed together with the new links once the interview is complete.
+        player_links = await fetch_json("data/member_tags.json")
+        stale_tags: list[str] = []
         player_select = None
-        d_player_select = None
         player = None
         player_options = {}
-        
-        # Check if user has linked accounts and validate them against API
-        for tag in copy.deepcopy(player_links.get(str(ctx.author.id), [])):
-            try:
-                player = await fetch_player(self.bot.coc, tag)
-            except coc.errors.NotFound:
-                player_links[str(ctx.author.id)].remove(tag)
+        # Linked players behind the dropdown options, so a selection reuses the object fetched here
+        linked_by_tag: dict[str, coc.Player] = {}
+
+        # Check if user has linked accounts and validate them against the API concurrently
+        linked_tags = list(player_links.get(str(ctx.author.id), []))
+        linked_players = await asyncio.gather(
+            *(fetch_player(self.bot.coc, tag) for tag in linked_tags), return_exceptions=True
+        )
+
+        for tag, player in zip(linked_tags, linked_players):
+            if isinstance(player, coc.errors.NotFound):
+                stale_tags.append(tag)
                 continue
+            if isinstance(player, BaseException):
+                raise player
 
-            townhall_emoji = ipy.PartialEmoji.from_str(get_app_emoji(f"Townhall{player.town_hall}"))
+            linked_by_tag[player.tag] = player
+            townhall_emoji = get_townhall_emoji(player.town_hall)
 
             player_options[player.tag] = ipy.StringSelectOption(
                 label=f"{player.name} ({player.tag})",
@@ -168,122 +207,127 @@ class FwaApplication(ipy.Extension):
                 placeholder="👤 Apply with your linked accounts",
                 custom_id="player_apply_select"
             )
-            d_player_select = copy.deepcopy(player_select)
+
+        # Bound once for the per-account loop below, which resolves them on every step and retry
+        account_count = int(res.values[0])
+        wait_for = self.bot.wait_for
+        wait_for_component = self.bot.wait_for_component
+        channel_send = ctx.channel.send
 
         # --- Step 2: Iterate through each account (1 or 2 times) ---
-        for i in range(1, int(res.values[0]) + 1):
+        for i in range(1, account_count + 1):
             
             # --- 2a. Request Player Tag ---
             embed = ipy.Embed(
                 title=f"**Can you kindly provide the tag of your {NUMBER_DICT[i]} account?**",
-                description=f"- Post the tag of your Clash of Clans account in the chat.\n"
-                            f"- Example answer: `#LCCYJVRUY` (can be copied from your profile)\n"
-                            f"- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help.",
+                description=tag_request_description,
                 footer=ipy.EmbedFooter(
                     text="Feel free to ask for help for any confusions."
                 ),
                 color=COLOR
             )
-            msg = await ctx.channel.send(embeds=[embed], components=player_select)
+            # The same menu is disabled in place once a tag is provided, so re-enable it for this account
+            if player_select:
+                player_select.disabled = False
+                player_select.placeholder = "👤 Apply with your linked accounts"
+            msg = await channel_send(embeds=[embed], components=player_select)
 
             fails = 0
-            while True:
-                wait_tasks = [
-                    asyncio.create_task(
-                        self.bot.wait_for("on_message_create", checks=msg_check, timeout=600),
-                        name="message"
-                    )
-                ]
-                if player_select:
-                    wait_tasks.append(
-                        asyncio.create_task(
-                            self.bot.wait_for_component(
-                                components=player_select, check=check, messages=int(msg.id), timeout=600),
-                            name="select"
-                        )
-                    )
+            # The waiters are created once per account and only the one that fired is replaced on the
+            # next pass, so an invalid chat message doesn't tear down and rebuild the dropdown wait.
+            message_task: asyncio.Task | None = None
+            select_task: asyncio.Task | None = None
 
-                done, pending = await asyncio.wait(wait_tasks, return_when=asyncio.FIRST_COMPLETED)
-                finished: asyncio.Task = list(done)[0]
+            # A single deadline covers the whole step instead of a separate timer on every waiter
+            deadline = asyncio.timeout(600)
 
-                for task in pending:
-                    try:
+            try:
+                async with deadline:
+                    while True:
+                        if message_task is None:
+                            message_task = asyncio.create_task(
+                                wait_for("on_message_create", checks=msg_check),
+                                name="message"
+                            )
+                        if player_select and select_task is None:
+                            select_task = asyncio.create_task(
+                                wait_for_component(components=player_select, check=check, messages=int(msg.id)),
+                                name="select"
+                            )
+
+                        wait_tasks = [task for task in (message_task, select_task) if task]
+                        done, _ = await asyncio.wait(wait_tasks, return_when=asyncio.FIRST_COMPLETED)
+                        finished: asyncio.Task = select_task if select_task in done else message_task
+
+                        # Release the task that fired so it is recreated if the loop continues
+                        if finished is message_task:
+                            message_task = None
+                        else:
+                            select_task = None
+
+                        action_name = finished.get_name()
+                        action_result: ipy.events.MessageCreate | ipy.events.Component = finished.result()
+
+                        if action_name == "message":
+                            # Handle manual tag entry via chat
+                            valid_tags = await extract_tags(self.bot.coc, action_result.message.content)
+                            if not valid_tags:
+                                if fails == 3:
+                                    await msg.edit(embed=FAIL_EMBED, components=FWA_RESTART_BUTTON)
+                                    raise asyncio.exceptions.CancelledError
+
+                                try:
+                                    await ctx.send(invalid_tag_message, ephemeral=True)
+                                except ipy.errors.HTTPException:
+                                    await channel_send(invalid_tag_message, ephemeral=True)
+                                fails += 1
+                                continue
+
+                            player = await fetch_player(self.bot.coc, valid_tags[0])
+
+                            if player_select:
+                                player_select.disabled = True
+                                player_select.placeholder = f"✅ Player tag is provided in chat"
+                                await msg.edit(components=player_select)
+
+                        else:
+                            # Handle tag selection via dropdown
+                            # Dropdown values are the tags of the linked players fetched above
+                            player = linked_by_tag[action_result.ctx.values[0]]
+                            player_select.disabled = True
+                            player_select.placeholder = f"✅ {player.name} ({player.tag}) is selected"
+                            await action_result.ctx.edit_origin(components=player_select)
+
+                        # Store the valid tag; it is linked at the end if no member has it yet
+                        accounts[player.tag] = player
+                        break
+            except TimeoutError:
+                # Only the step deadline counts as the user timing out
+                if not deadline.expired():
+                    raise
+                raise ComponentTimeoutError(message=msg)
+            finally:
+                # Cancel any waiter that is still pending
+                for task in (message_task, select_task):
+                    if task and not task.done():
                         task.cancel()
-                    except asyncio.CancelledError:
-                        pass
-
-                action_name = finished.get_name()
-
-                try:
-                    action_result: ipy.events.MessageCreate | ipy.events.Component = finished.result()
-                except asyncio.TimeoutError:
-                    raise ComponentTimeoutError(message=msg)
-
-                if action_name == "message":
-                    # Handle manual tag entry via chat
-                    valid_tags = await extract_tags(self.bot.coc, action_result.message.content)
-                    if not valid_tags:
-                        if fails == 3:
-                            await msg.edit(embed=FAIL_EMBED, components=FWA_RESTART_BUTTON)
-                            raise asyncio.exceptions.CancelledError
-
-                        try:
-                            await ctx.send(f"{get_app_emoji('error')} Please provide a valid tag in the chat.", ephemeral=True)
-                        except ipy.errors.HTTPException:
-                            await ctx.channel.send(f"{get_app_emoji('error')} Please provide a valid tag in the chat.",
-                                                   ephemeral=True)
-                        fails += 1
-                        continue
-
-                    player = await fetch_player(self.bot.coc, valid_tags[0])
-
-                    if player_select:
-                        d_player_select.disabled = True
-                        d_player_select.placeholder = f"✅ Player tag is provided in chat"
-                        await msg.edit(components=d_player_select)
-
-                else:
-                    # Handle tag selection via dropdown
-                    player = await fetch_player(self.bot.coc, action_result.ctx.values[0])
-                    d_player_select.disabled = True
-                    d_player_select.placeholder = f"✅ {player.name} ({player.tag}) is selected"
-                    await action_result.ctx.edit_origin(components=d_player_select)
-
-                # Store the valid tag and link it if new
-                account_tags.append(player.tag)
-                player_links = json.load(open("data/member_tags.json", "r"))
-                player_links_reversed = reverse_dict(player_links)
-
-                if player.tag not in player_links_reversed:
-                    player_links.setdefault(str(ctx.author.id), []).append(player.tag)
-                break
 
             # --- 2b. Request FWA Base Screenshot ---
             embed = ipy.Embed(
                 title=f"**Can you kindly send a screenshot of the FWA base of your {NUMBER_DICT[i]} account?**",
-                description=f"- Please upload the screenshot as an attachment or send it as image URL.\n"
-                            f"- This section is **compulsory**, and the base must be FWA base currently activated in your war base!\n"
-                            f"- Go to this [message]({jump_url}) and click **\"Human Support\"** button for help.",
+                description=screenshot_request_description,
                 footer=ipy.EmbedFooter(
                     text="Feel free to ask for help for any confusions."
                 ),
                 color=COLOR
             )
 
-            # Button to help users find FWA base layouts
-            base_button = ipy.Button(
-                style=ipy.ButtonStyle.LINK,
-                label="Get FWA Base",
-                url="https://discord.com/channels/1167707509813940245/1336857708996988938",
-                emoji=ipy.PartialEmoji(name="🔨")
-            )
-
-            msg = await ctx.channel.send(embeds=[embed], components=base_button)
+            msg = await channel_send(embeds=[embed], components=FWA_BASE_BUTTON)
 
             fails = 0
             while True:
                 try:
-                    res: ipy.events.MessageCreate = await self.bot.wait_for(
+                    res: ipy.events.MessageCreate = await wait_for(
                         'on_message_create', checks=msg_check, timeout=600
                     )
                 except asyncio.TimeoutError:
@@ -294,35 +338,39 @@ class FwaApplication(ipy.Extension):
                     acc_images[player.tag] = res.message.attachments[0].url
                     break
 
-                # Check for image URL in text
-                if not validators.url(res.message.content) or not await is_url_image(res.message.content):
+                # Check for image URL in text. The cheap scheme prefix test runs first so ordinary chatter
+                # never reaches the URL validator, and only well-formed URLs trigger the image lookup request.
+                content = res.message.content.strip()
+                if (
+                    not content.startswith(("http://", "https://"))
+                    or not validators.url(content)
+                    or not await is_url_image(content)
+                ):
                     if fails == 3:
                         await msg.edit(embed=FAIL_EMBED, components=FWA_RESTART_BUTTON)
                         raise asyncio.exceptions.CancelledError
                     try:
-                        await ctx.send(f"{get_app_emoji('error')} Your response must contain an attachment or a image link.",
-                                       ephemeral=True)
+                        await ctx.send(image_required_message, ephemeral=True)
                     except ipy.errors.HTTPException:
-                        await ctx.channel.send(
-                            f"{get_app_emoji('error')} Your response must contain an attachment or a image link.",
-                            ephemeral=True)
+                        await channel_send(image_required_message, ephemeral=True)
                     fails += 1
                     continue
 
-                acc_images[player.tag] = res.message.content
+                acc_images[player.tag] = content
                 break
 
         # --- Step 3: Finalize and Save Data ---
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        # Link changes are applied to freshly loaded links and saved in one step
+        await update_player_links(ctx.author.id, new_tags=accounts, stale_tags=stale_tags)
 
-        packages = json.load(open("data/packages.json", "r"))
+        packages = await fetch_json("data/packages.json")
         package_token = secrets.token_hex(8)
         package = {"acc_images": acc_images}
         packages[package_token] = package
 
-        with open("data/packages.json", "w") as file:
-            json.dump(packages, file, indent=4)
+        # Written in the background so the summary isn't held up by the disk write.
+        # Member links were already saved with `update_player_links` after the account step.
+        queue_store_json("data/packages.json", packages, indent=None)
 
         # --- Step 4: Eligibility Check and Summary Generation ---
         embed = ipy.Embed(
@@ -339,43 +387,23 @@ class FwaApplication(ipy.Extension):
             color=COLOR
         )
 
-        # Determine Minimum FWA Town Hall Requirement from config
-        clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
-        fwa_reqs = []
-        for value in clans_config.values():
-            if value["type"] != "FWA":
-                continue
-            fwa_reqs.append(extract_integer(value["requirement"]))
-        
-        min_fwa_req = min(fwa_reqs) if fwa_reqs else 13 # Default fallback
+        # Determine Minimum FWA Town Hall Requirement from config (cached until the config changes)
+        min_fwa_req = await get_min_fwa_req()
 
-        account_tags = list(set(account_tags))
-        player_options = []
-        player_summary = ""
-        
-        # Filter eligible accounts and build summary
-        for account_tag in account_tags:
-            player = await fetch_player(self.bot.coc, account_tag)
+        summary_parts: list[str] = []
 
+        # Filter eligible accounts and build summary, one line per account joined at the end
+        for player in accounts.values():
             if player.town_hall < min_fwa_req:
                 continue
 
-            townhall_emoji = ipy.PartialEmoji.from_str(get_app_emoji(f"Townhall{player.town_hall}"))
             formatted_tag = player.tag[1:]
             player_url = f"https://cc.fwafarm.com/cc_n/member.php?tag=%23{formatted_tag}"
             
             th_icon = get_app_emoji(f"Townhall{player.town_hall}")
-            player_summary += f"{th_icon}[{player.name} ({player.tag})]({player.share_link}) ({player_url}) \n"
-            if len(account_tags) == 1:
-                continue
+            summary_parts.append(f"{th_icon}[{player.name} ({player.tag})]({player.share_link}) ({player_url}) \n")
 
-            player_option = ipy.StringSelectOption(
-                label=f"{player.name} ({player.tag})",
-                description=f"{player.role} of {player.clan}" if player.clan else "Not in a clan",
-                value=player.tag,
-                emoji=townhall_emoji
-            )
-            player_options.append(player_option)
+        player_summary = "".join(summary_parts)
 
         # If eligible accounts exist, add them to the summary
         if player_summary:
@@ -388,7 +416,7 @@ class FwaApplication(ipy.Extension):
             # If no accounts meet the TH requirement, deny the application immediately
             embed = ipy.Embed(
                 title=f"**Application Denied**",
-                description=f"{get_app_emoji('error')} We are sorry that you are **not eligible** for FWA clans. The "
+                description=f"{error_emoji} We are sorry that you are **not eligible** for FWA clans. The "
                             f"minimum townhall to join a FWA clan is `TH{min_fwa_req}`.\n",
                 footer=ipy.EmbedFooter(
                     text="Applied Time"
@@ -402,15 +430,18 @@ class FwaApplication(ipy.Extension):
         # Use dynamic config for FWA Rep role notification
         config: sc.GuildConfig = sc.get_config(ctx.guild.id)
         
+        async def send_thank_you():
+            """Confirm the submission to the applicant, ignoring an expired interaction."""
+            try:
+                await ctx.send(f"{get_app_emoji('success')} **Thank you** for applying, please wait patiently for the clan leaders!",
+                               ephemeral=True)
+            except ipy.errors.HTTPException:
+                pass
+
         await ctx.channel.send(LINE_URL)
         await ctx.channel.send(f"<@&{config.FWA_REP_ROLE}>", embeds=[embed])
-        await ctx.channel.send(LINE_URL)
-
-        try:
-            await ctx.send(f"{get_app_emoji('success')} **Thank you** for applying, please wait patiently for the clan leaders!",
-                           ephemeral=True)
-        except ipy.errors.HTTPException:
-            pass
+        # The closing divider and the ephemeral confirmation are independent, so they are sent together
+        await asyncio.gather(ctx.channel.send(LINE_URL), send_thank_you())
 
 def setup(bot: ipy.Client):
     """
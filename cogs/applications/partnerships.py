@@ -14,10 +14,9 @@ Dependencies:
 import interactions as ipy
 
 # Explicit imports to maintain code clarity
-from core.utils import extract_integer, extract_alphabets
+from core.utils import verify_applicant
 from core.models import COLOR
 from core.emojis_manager import get_app_emoji
-from core import server_setup as sc
 
 class PartnershipApplication(ipy.Extension):
     """
@@ -44,23 +43,11 @@ class PartnershipApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
-
         # Identity Verification:
         # We must ensure that the person clicking the button is the actual applicant.
         # Check 1: Does the User ID extracted from the channel topic match?
-        is_topic_owner = extract_integer(ctx.channel.topic) == int(member.id)
-        
-        # Check 2: Does the username in the channel name (ticket┃username) match?
-        # This serves as a fallback if the topic is missing or malformed.
-        try:
-            channel_username = ctx.channel.name.split("┃")[1]
-            is_name_owner = extract_alphabets(member.username) == channel_username
-        except IndexError:
-            # Handle edge case where channel name format is incorrect
-            is_name_owner = False
-
-        if not is_topic_owner and not is_name_owner:
+        # Check 2 only runs when Check 1 fails, so the username regex is skipped on the happy path.
+        if not verify_applicant(ctx):
             await ctx.send(
                 f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
                 ephemeral=True
@@ -20,7 +20,6 @@ Dependencies:
 
 import interactions as ipy
 import difflib
-import json
 import re
 from datetime import datetime, timedelta, timezone
 
@@ -90,11 +89,8 @@ class StaffApplication(ipy.Extension):
             ctx (ipy.ComponentContext): The context of the menu interaction.
         """
         # Identity Verification:
-        # Validate that the user interacting is the ticket owner.
-        topic_id = extract_integer(ctx.channel.topic) if ctx.channel.topic else 0
-        channel_user_name = ctx.channel.name.split("┃")[1] if "┃" in ctx.channel.name else ""
-        
-        if topic_id != int(ctx.author.id) and extract_alphabets(ctx.author.username) != channel_user_name:
+        # Validate that the user interacting is the ticket owner (topic ID first, channel name as fallback).
+        if not verify_applicant(ctx):
             await ctx.send(f"{get_app_emoji('error')} Only the applicant of this channel can start the interview!",
                            ephemeral=True)
             return
@@ -107,7 +103,7 @@ class StaffApplication(ipy.Extension):
         modified_name = staff_name.replace(" ", "0")
         
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             await ctx.send(f"{get_app_emoji('error')} Configuration file not found.", ephemeral=True)
             return
@@ -148,7 +144,7 @@ class StaffApplication(ipy.Extension):
             ctx (ipy.ModalContext): The context of the modal submission.
         """
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             return
 
@@ -328,12 +324,11 @@ class StaffCommands(ipy.Extension):
 
         # Remove trial from active events database
         try:
-            trial_events = json.load(open("data/trial_events.json", "r"))
+            trial_events = await fetch_json("data/trial_events.json")
             key = f"{ctx.channel.id}|{member.id}"
             if key in trial_events:
                 del trial_events[key]
-                with open("data/trial_events.json", "w") as file:
-                    json.dump(trial_events, file, indent=4)
+                await store_json("data/trial_events.json", trial_events)
         except FileNotFoundError:
             pass
 
@@ -401,7 +396,7 @@ class StaffCommands(ipy.Extension):
 
         # Register event in database
         try:
-            trial_events = json.load(open("data/trial_events.json", "r"))
+            trial_events = await fetch_json("data/trial_events.json")
         except FileNotFoundError:
             trial_events = {}
 
@@ -410,8 +405,7 @@ class StaffCommands(ipy.Extension):
             "action": "end",
             "type": staff_name
         }
-        with open("data/trial_events.json", "w") as file:
-            json.dump(trial_events, file, indent=4)
+        await store_json("data/trial_events.json", trial_events)
 
         embed = ipy.Embed(
             title="**Trial Has Started**",
@@ -445,7 +439,7 @@ class StaffCommands(ipy.Extension):
         Edits the text or type of a specific question for a staff position.
         """
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             await ctx.send(f"{get_app_emoji('error')} Config file not found.", ephemeral=True)
             return
@@ -453,8 +447,7 @@ class StaffCommands(ipy.Extension):
         if question_type:
             trial_config[staff_name]["questions"][question_index]["type"] = question_type
 
-            with open("data/trial_config.json", "w") as file:
-                json.dump(trial_config, file, indent=4)
+            await store_json("data/trial_config.json", trial_config)
 
         modal = ipy.Modal(
             ipy.ShortText(
@@ -478,15 +471,14 @@ class StaffCommands(ipy.Extension):
     @ipy.modal_callback("staff_questions_edit")
     async def staff_questions_edit_modal(self, ctx: ipy.ModalContext, **modal_data):
         staff_name, question_index = list(modal_data.keys())[0].split("|")
-        trial_config = json.load(open("data/trial_config.json", "r"))
+        trial_config = await fetch_json("data/trial_config.json")
         
         # Responses are in the values
         values = list(modal_data.values())
         trial_config[staff_name]["questions"][int(question_index)]["question"] = values[0]
         trial_config[staff_name]["questions"][int(question_index)]["placeholder"] = values[1]
 
-        with open("data/trial_config.json", "w") as file:
-            json.dump(trial_config, file, indent=4)
+        await store_json("data/trial_config.json", trial_config)
 
         await ctx.send(f"{get_app_emoji('success')} Question {int(question_index) + 1} is successfully edited.", ephemeral=True)
 
@@ -502,14 +494,13 @@ class StaffCommands(ipy.Extension):
             return
 
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             return
 
         trial_config[staff_name]["application"] = str(application_status)
 
-        with open("data/trial_config.json", "w") as file:
-            json.dump(trial_config, file, indent=4)
+        await store_json("data/trial_config.json", trial_config)
 
         await ctx.send(f"{get_app_emoji('success')} Staff position application status is successfully edited.",
                        ephemeral=True)
@@ -524,7 +515,7 @@ class StaffCommands(ipy.Extension):
         await ctx.defer(ephemeral=True)
 
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             trial_config = {}
 
@@ -553,8 +544,7 @@ class StaffCommands(ipy.Extension):
                 "application": "False"
             }
 
-        with open("data/trial_config.json", "w") as file:
-            json.dump(trial_config, file, indent=4)
+        await store_json("data/trial_config.json", trial_config)
 
         await ctx.send(f"{get_app_emoji('success')} `{staff_name}` is added to the staff application.", ephemeral=True)
 
@@ -571,14 +561,13 @@ class StaffCommands(ipy.Extension):
             return
 
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             return
 
         if staff_name in trial_config:
             del trial_config[staff_name]
-            with open("data/trial_config.json", "w") as file:
-                json.dump(trial_config, file, indent=4)
+            await store_json("data/trial_config.json", trial_config)
             await ctx.send(f"{get_app_emoji('success')} `{staff_name}` is removed from staff application.", ephemeral=True)
         else:
             await ctx.send(f"{get_app_emoji('error')} `{staff_name}` does not exist.", ephemeral=True)
@@ -590,7 +579,7 @@ class StaffCommands(ipy.Extension):
         Fetches available staff positions from trial_config.json.
         """
         try:
-            trial_config = json.load(open("data/trial_config.json", "r"))
+            trial_config = await fetch_json("data/trial_config.json")
         except FileNotFoundError:
             return
 
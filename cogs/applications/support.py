@@ -14,8 +14,7 @@ Dependencies:
 import interactions as ipy
 
 # Explicit imports to maintain code clarity
-from core.utils import extract_integer, extract_alphabets
-from core.models import * 
+from core.utils import verify_applicant
 from core.emojis_manager import get_app_emoji
 
 class SupportApplication(ipy.Extension):
@@ -44,15 +43,13 @@ class SupportApplication(ipy.Extension):
         Args:
             ctx (ipy.ComponentContext): The context of the button interaction.
         """
-        member = ctx.author
-
         # Identity Verification:
         # Ensure that the user clicking the button is the owner of the ticket.
         # This prevents other users (or staff) from accidentally triggering applicant-only workflows.
         # Check 1: Match User ID against the channel topic.
         # Check 2: Match Username against the channel name (fallback).
-        if extract_integer(ctx.channel.topic) != int(member.id) and \
-                extract_alphabets(member.username) != ctx.channel.name.split("┃")[1]:
+        # Check 2 only runs when Check 1 fails; channel names without a separator fail it.
+        if not verify_applicant(ctx):
             await ctx.send(f"{get_app_emoji('error')} Only the applicant of this channel can interact!",
                            ephemeral=True)
             return
@@ -21,7 +21,7 @@ import coc
 import os
 
 # Explicit imports for internal utilities
-from core.utils import fetch_overwrites, bot_restart
+from core.utils import fetch_overwrites, bot_restart, fetch_json, queue_store_json
 from core.models import ApplicationPackage
 import core.server_setup as sc
 
@@ -91,8 +91,10 @@ class Events(ipy.Extension):
         Args:
             event (ipy.events.MessageDelete): The message delete event payload.
         """
+        # packages.json goes through the shared helpers (like the application flows writing it),
+        # so this cleanup and a queued application write never overwrite each other.
         try:
-            packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
+            packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
         except (FileNotFoundError, json.JSONDecodeError):
             return
 
@@ -103,8 +105,7 @@ class Events(ipy.Extension):
             # Delete the first matching package found
             del packages[keys[0]]
 
-            with open("data/packages.json", "w") as file:
-                json.dump(packages, file, indent=4)
+            queue_store_json("data/packages.json", packages, indent=None)
 
     @ipy.listen(ipy.events.ChannelDelete)
     async def on_channel_delete(self, event: ipy.events.ChannelDelete):
@@ -121,7 +122,7 @@ class Events(ipy.Extension):
         """
         # 1. Cleanup Application Packages
         try:
-            packages: dict[str, ApplicationPackage] = json.load(open("data/packages.json", "r"))
+            packages: dict[str, ApplicationPackage] = await fetch_json("data/packages.json")
         except (FileNotFoundError, json.JSONDecodeError):
             packages = {}
 
@@ -130,8 +131,7 @@ class Events(ipy.Extension):
             for key in keys:
                 del packages[key]
 
-            with open("data/packages.json", "w") as file:
-                json.dump(packages, file, indent=4)
+            queue_store_json("data/packages.json", packages, indent=None)
 
         # 2. Cleanup Open Tickets Registry
         try:
@@ -24,7 +24,6 @@ Dependencies:
 
 import interactions as ipy
 import json
-import copy
 import asyncio
 import coc
 import random
@@ -70,7 +69,8 @@ class PlayerCmds(ipy.Extension):
         """
         await ctx.defer(ephemeral=True if hidden else False)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
+        # Shared links data (served from memory while the file is unchanged); changes go through `update_player_links`
+        player_links = await fetch_json("data/member_tags.json")
 
         # Validation: User existence check
         if isinstance(user, str):
@@ -88,15 +88,17 @@ class PlayerCmds(ipy.Extension):
         player_options = []
         count = 0
         player_summary = ""
+        stale_tags = []
 
         # Iterate through all tags linked to the user
-        # We use a deepcopy to safely iterate while potentially modifying the source list (removing invalid tags)
-        for tag in copy.deepcopy(player_links[str(user.id)]):
+        # We iterate a shallow copy so the list can't change under the loop while players are fetched.
+        # The tags are immutable strings, so a deepcopy would only add overhead.
+        for tag in list(player_links[str(user.id)]):
             try:
                 player = await fetch_player(self.bot.coc, tag)
             except coc.errors.NotFound:
-                # Cleanup: Automatically remove tags that no longer exist in the API
-                player_links[str(user.id)].remove(tag)
+                # Cleanup: Tags that no longer exist in the API are removed after the loop
+                stale_tags.append(tag)
                 continue
 
             count += 1
@@ -165,7 +167,7 @@ class PlayerCmds(ipy.Extension):
                 )
             )
 
-            townhall_emoji = ipy.PartialEmoji.from_str(get_app_emoji(f"Townhall{player.town_hall}"))
+            townhall_emoji = get_townhall_emoji(player.town_hall)
 
             # Logic for Clan Status (In Clan vs No Clan)
             if not player.clan:
@@ -225,9 +227,9 @@ class PlayerCmds(ipy.Extension):
             )
             player_profiles.append(embed)
 
-        # Update JSON if any stale tags were removed
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        # Update JSON if any stale tags were found
+        if stale_tags:
+            await update_player_links(user.id, stale_tags=stale_tags)
 
         # Construct the "Main Menu" embed (Summary of all accounts)
         footer = ipy.EmbedFooter(
@@ -309,8 +311,8 @@ class PlayerCmds(ipy.Extension):
         """
         await ctx.defer(ephemeral=True)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
-        player_links_reversed = reverse_dict(player_links)
+        player_links = await fetch_json("data/member_tags.json")
+        linked_tags = await fetch_linked_tags()
 
         # Parse and validate the provided tags via API
         valid_tags = await extract_tags(self.bot.coc, player_tags, context=ctx)
@@ -325,23 +327,24 @@ class PlayerCmds(ipy.Extension):
                 ephemeral=True)
             return
 
+        new_tags = []
+
         for tag in valid_tags:
             # Check 1: Already linked to this user
-            if tag in player_links.get(str(user.id), []):
+            if tag in player_links.get(str(user.id), []) or tag in new_tags:
                 await ctx.send(f"{get_app_emoji('error')} `{tag}` is already linked to this user.", ephemeral=True)
                 continue
 
             # Check 2: Already linked to SOMEONE ELSE
-            if tag in player_links_reversed:
+            if tag in linked_tags:
                 await ctx.send(f"{get_app_emoji('error')} `{tag}` is already linked to another user.", ephemeral=True)
                 continue
 
             # Success: Link the tag
-            player_links.setdefault(str(user.id), []).append(tag)
+            new_tags.append(tag)
             await ctx.send(f"{get_app_emoji('success')} `{tag}` is successfully linked.", ephemeral=True)
 
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(user.id, new_tags=new_tags)
 
 
     @ipy.message_context_menu(name="Link Accounts")
@@ -356,8 +359,8 @@ class PlayerCmds(ipy.Extension):
         # Fetch the message author as a Member object within the guild context
         user = await self.bot.fetch_member(ctx.target.author.id, ctx.guild_id, force=True)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
-        player_links_reversed = reverse_dict(player_links)
+        player_links = await fetch_json("data/member_tags.json")
+        linked_tags = await fetch_linked_tags()
 
         # Extract tags from message content
         valid_tags = await extract_tags(self.bot.coc, ctx.target.content, context=ctx)
@@ -372,20 +375,21 @@ class PlayerCmds(ipy.Extension):
                 ephemeral=True)
             return
 
+        new_tags = []
+
         for tag in valid_tags:
-            if tag in player_links.get(str(user.id), []):
+            if tag in player_links.get(str(user.id), []) or tag in new_tags:
                 await ctx.send(f"{get_app_emoji('error')} `{tag}` is already linked to this user.", ephemeral=True)
                 continue
 
-            if tag in player_links_reversed:
+            if tag in linked_tags:
                 await ctx.send(f"{get_app_emoji('error')} `{tag}` is already linked to another user.", ephemeral=True)
                 continue
 
-            player_links.setdefault(str(user.id), []).append(tag)
+            new_tags.append(tag)
             await ctx.send(f"{get_app_emoji('success')} `{tag}` is successfully linked.", ephemeral=True)
 
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(user.id, new_tags=new_tags)
 
 
     @player_base.subcommand(sub_cmd_name="unlink", sub_cmd_description="Unlink Clash of Clans accounts to a user")
@@ -415,7 +419,7 @@ class PlayerCmds(ipy.Extension):
         """
         await ctx.defer(ephemeral=True)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
+        player_links = await fetch_json("data/member_tags.json")
 
         # Verify tag existence via API, unless "all" option is selected
         player = None
@@ -435,17 +439,17 @@ class PlayerCmds(ipy.Extension):
 
         # Determine if unlinking specific tag or ALL tags
         tags = player_links[str(user_id)] if player_tag == "all" else [player.tag]
+        removed_tags = []
         
         for tag in tags:
             if tag not in player_links.get(str(user.id), []):
                 await ctx.send(f"{get_app_emoji('error')} The account `{tag}` is not linked to the user.", ephemeral=True)
                 continue
 
-            player_links[str(user_id)].remove(tag)
+            removed_tags.append(tag)
             await ctx.send(f"{get_app_emoji('success')} `{tag}` is successfully removed.", ephemeral=True)
 
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(user_id, stale_tags=removed_tags)
 
 
     @player_unlink.autocomplete(option_name="player_tag")
@@ -459,7 +463,7 @@ class PlayerCmds(ipy.Extension):
             return
 
         user_id = ctx.kwargs["user_id"] if "user_id" in ctx.kwargs else ctx.kwargs["user"]
-        player_links = json.load(open("data/member_tags.json", "r"))
+        player_links = await fetch_json("data/member_tags.json")
 
         if not player_links.get(user_id, []):
             tag_choice = [{"name": "No accounts linked to this player", "value": "None"}]
@@ -467,12 +471,13 @@ class PlayerCmds(ipy.Extension):
             return
 
         tag_choices = []
+        stale_tags = []
         # Create choices for each linked tag
-        for tag in copy.deepcopy(player_links[user_id]):
+        for tag in list(player_links[user_id]):
             try:
                 player = await fetch_player(self.bot.coc, tag)
             except coc.errors.NotFound:
-                player_links[ctx.kwargs["user"]].remove(tag)
+                stale_tags.append(tag)
                 continue
 
             name = f"[TH{player.town_hall}] {player.name} ({player.tag})"
@@ -484,8 +489,8 @@ class PlayerCmds(ipy.Extension):
         await ctx.send(tag_choices)
 
         # Persist cleanup of invalid tags if any occurred during loop
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        if stale_tags:
+            await update_player_links(user_id, stale_tags=stale_tags)
 
 
     @ipy.message_context_menu(name="Unlink Accounts")
@@ -498,7 +503,7 @@ class PlayerCmds(ipy.Extension):
         await ctx.defer(ephemeral=True)
 
         user = await self.bot.fetch_member(ctx.target.author.id, ctx.guild_id, force=True)
-        player_links = json.load(open("data/member_tags.json", "r"))
+        player_links = await fetch_json("data/member_tags.json")
 
         tags = await extract_tags(self.bot.coc, ctx.target.content, context=ctx)
 
@@ -506,16 +511,17 @@ class PlayerCmds(ipy.Extension):
             await ctx.send(f"{get_app_emoji('error')} Please provide at least one valid player tag.", ephemeral=True)
             return
 
+        removed_tags = []
+
         for tag in tags:
-            if tag not in player_links.get(str(user.id), []):
+            if tag not in player_links.get(str(user.id), []) or tag in removed_tags:
                 await ctx.send(f"{get_app_emoji('error')} `{tag}` is not linked to this user.", ephemeral=True)
                 continue
 
-            player_links[str(user.id)].remove(tag)
+            removed_tags.append(tag)
             await ctx.send(f"{get_app_emoji('success')} `{tag}` is successfully removed.", ephemeral=True)
 
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(user.id, stale_tags=removed_tags)
 
 
     @player_base.subcommand(sub_cmd_name="verify", sub_cmd_description="Set roles and edit nickname of a user")
@@ -560,8 +566,8 @@ class PlayerCmds(ipy.Extension):
         """
         await ctx.defer(ephemeral=True)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
-        player_links_reversed = reverse_dict(player_links)
+        player_links = await fetch_json("data/member_tags.json")
+        linked_tags = await fetch_linked_tags()
 
         try:
             member = await self.bot.fetch_member(user.id, ctx.guild_id, force=True)
@@ -594,6 +600,7 @@ class PlayerCmds(ipy.Extension):
 
         valid_tags = []
         valid_roles = []
+        new_tags = []
         joined_clans = []
         player_townhalls = []
         
@@ -609,8 +616,8 @@ class PlayerCmds(ipy.Extension):
                 player_townhalls.append(th_role)
 
             # Auto-link if not already linked
-            if player_tag not in player_links_reversed:
-                player_links.setdefault(str(member.id), []).append(player.tag)
+            if player_tag not in linked_tags:
+                new_tags.append(player.tag)
 
             # Check if player is in a clan
             if not player.clan:
@@ -630,8 +637,7 @@ class PlayerCmds(ipy.Extension):
             valid_roles.append(clans_config[player.clan.tag]["role"])
 
         # Save any auto-links created
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(member.id, new_tags=new_tags)
         
         valid_roles += player_townhalls
         
@@ -782,8 +788,8 @@ class PlayerCmds(ipy.Extension):
         """
         await ctx.defer(ephemeral=True)
 
-        player_links = json.load(open("data/member_tags.json", "r"))
-        player_links_reversed = reverse_dict(player_links)
+        player_links = await fetch_json("data/member_tags.json")
+        linked_tags = await fetch_linked_tags()
 
         try:
             member = await self.bot.fetch_member(ctx.target.author.id, ctx.guild_id, force=True)
@@ -810,6 +816,7 @@ class PlayerCmds(ipy.Extension):
 
         valid_tags = []
         valid_roles = []
+        new_tags = []
         player_townhalls = []
         
         config: sc.GuildConfig = sc.get_config(ctx.guild.id)
@@ -821,8 +828,8 @@ class PlayerCmds(ipy.Extension):
             if th_role:
                 player_townhalls.append(th_role)
 
-            if player_tag not in player_links_reversed:
-                player_links.setdefault(str(member.id), []).append(player.tag)
+            if player_tag not in linked_tags:
+                new_tags.append(player.tag)
 
             if not player.clan:
                 await ctx.send(f"{get_app_emoji('error')} `{player.name} ({player.tag})` is not in any clan!",
@@ -837,8 +844,7 @@ class PlayerCmds(ipy.Extension):
             valid_tags.append(player.tag)
             valid_roles.append(clans_config[player.clan.tag]["role"])
 
-        with open("data/member_tags.json", "w") as file:
-            json.dump(player_links, file, indent=4)
+        await update_player_links(member.id, new_tags=new_tags)
         
         valid_roles += player_townhalls
         invalid_roles = list(set(member_roles).intersection(clan_roles) - set(valid_roles))
@@ -890,7 +896,7 @@ class PlayerCmds(ipy.Extension):
 
         # Default to current nickname or username
         player_name = member.nickname if member.nickname else member.username
-        player_links = json.load(open("data/member_tags.json", "r"))
+        player_links = await fetch_json("data/member_tags.json")
         clans_config: dict[str, AllianceClanData] = json.load(open("data/clans_config.json", "r"))
 
         if "player_tags" not in ctx.kwargs:
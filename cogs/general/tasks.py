@@ -79,13 +79,14 @@ class Tasks(ipy.Extension):
             return
 
         try:
-            with open("data/packages.json", "r") as f:
-                packages = json.load(f)
+            # packages.json goes through the shared helpers, like every other writer of the file
+            packages = await fetch_json("data/packages.json")
             
             tokens_to_delete = []
             
-            # Identify stale entries
-            for token, data in packages.items():
+            # Identify stale entries. A snapshot is iterated since applications can add packages
+            # to the shared data while the channel checks are awaited.
+            for token, data in list(packages.items()):
                 channel_id = data.get("channel_id")
                 
                 if not channel_id:
@@ -104,11 +105,12 @@ class Tasks(ipy.Extension):
 
             # Perform deletion
             if tokens_to_delete:
+                # Reloaded so packages written during the checks are kept (a stat call if unchanged)
+                packages = await fetch_json("data/packages.json")
                 for token in tokens_to_delete:
-                    del packages[token]
+                    packages.pop(token, None)
                 
-                with open("data/packages.json", "w") as f:
-                    json.dump(packages, f, indent=4)
+                queue_store_json("data/packages.json", packages, indent=None)
                 print(f"🗑️ Removed {len(tokens_to_delete)} stale entries from packages.json")
 
         except json.JSONDecodeError:
@@ -157,6 +157,10 @@ class TicketManager:
                 topic=f"Applicant ID: {member.id}"
             )
 
+        # Prime the ticket identity caches, so the first button press in the ticket skips parsing the channel
+        get_channel_owner_id(channel)
+        get_channel_username(channel)
+
         # Register the new ticket in the persistence file
         try:
             open_tickets = json.load(open("data/open_tickets.json", "r"))
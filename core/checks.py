@@ -17,7 +17,9 @@ Dependencies:
     - interactions (Discord slash command choices)
 """
 
+import asyncio
 import coc
+import inspect
 import interactions as ipy
 
 def hero_sum_check(target: coc.Player, min_value: int) -> bool:
@@ -120,6 +122,45 @@ CLAN_CHECKS = {
     "overall_max": overall_max_check,
 }
 
+# Whether each check expects the API client as a `client` keyword argument.
+# Resolved once here so callers don't inspect function signatures on every evaluation.
+CLAN_CHECK_WANTS_CLIENT = {
+    key: "client" in inspect.signature(func).parameters
+    for key, func in CLAN_CHECKS.items()
+}
+
+async def run_clan_checks(target: coc.Player, checks: dict[str, dict], client: coc.Client) -> bool:
+    """
+    Evaluates the configured checks of a clan against a player.
+
+    The checks run concurrently and the remaining ones are cancelled as soon as one fails.
+    The configured kwargs are never mutated; the API client is passed through a copy.
+
+    Args:
+        target (coc.Player): The player object.
+        checks (dict[str, dict]): The clan's checks, mapping check keys to their kwargs.
+        client (coc.Client): The API client, for checks that query the API.
+
+    Returns:
+        bool: True if the player passes every check.
+    """
+    tasks = []
+    for check, check_kwargs in checks.items():
+        if CLAN_CHECK_WANTS_CLIENT[check]:
+            check_kwargs = {**check_kwargs, "client": client}
+
+        tasks.append(asyncio.ensure_future(ipy.utils.maybe_coroutine(CLAN_CHECKS[check], target, **check_kwargs)))
+
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            if not await next_result:
+                return False
+        return True
+    finally:
+        # Stop any check still running once the outcome is known
+        for task in tasks:
+            task.cancel()
+
 # User-friendly names for the checks, used in UI/Embeds.
 CLAN_CHECK_NAMES = {
     "hero_sum": "Hero Level Sum",
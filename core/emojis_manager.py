@@ -15,12 +15,19 @@ Dependencies:
     - interactions (Discord interactions)
 """
 
+import time
+from functools import lru_cache
+
 import interactions as ipy
 
 # Global storage for emoji strings
 emoji_cache = {}
+# Monotonic time of the last fetch from the API, used to skip refreshes of a warm cache
+emoji_fetched_at = 0.0
+# Default age (seconds) after which callers refreshing on every use fetch the emojis again
+EMOJI_REFRESH_INTERVAL = 300
 
-async def fetch_emojis(bot: ipy.Client, update: bool = False) -> dict:
+async def fetch_emojis(bot: ipy.Client, update: bool = False, max_age: float | None = None) -> dict:
     """
     Retrieves all custom emojis available to the bot application.
 
@@ -30,16 +37,22 @@ async def fetch_emojis(bot: ipy.Client, update: bool = False) -> dict:
     Args:
         bot (ipy.Client): The main bot instance used to fetch application emojis.
         update (bool): If True, forces a refresh of the cache from the Discord API.
+        max_age (float | None): If given, an update is skipped while the cache was
+            fetched less than this many seconds ago.
 
     Returns:
         dict: A dictionary mapping emoji names to their Discord string representation.
     """
-    global emoji_cache
+    global emoji_cache, emoji_fetched_at
 
     # Return existing cache if populated and no update requested
     if emoji_cache and not update:
         return emoji_cache
 
+    # Return existing cache if it is still fresh enough for the caller
+    if emoji_cache and max_age is not None and time.monotonic() - emoji_fetched_at < max_age:
+        return emoji_cache
+
     # Fetch fresh list of emojis from the application
     application_emojis = await bot.fetch_application_emojis()
     
@@ -47,6 +60,8 @@ async def fetch_emojis(bot: ipy.Client, update: bool = False) -> dict:
     for emoji in application_emojis:
         emoji_cache[emoji.name] = str(emoji)
 
+    emoji_fetched_at = time.monotonic()
+
     return emoji_cache
 
 
@@ -64,4 +79,42 @@ def get_app_emoji(emoji_name: str) -> str:
     global emoji_cache
     
     # Return the cached emoji or fall back to the plain text name
-    return emoji_cache.get(emoji_name, emoji_name)
\ No newline at end of file
+    return emoji_cache.get(emoji_name, emoji_name)
+
+
+@lru_cache(maxsize=256)
+def _parse_partial_emoji(emoji_str: str) -> ipy.PartialEmoji | None:
+    """
+    Parses an emoji string into a PartialEmoji, memoized on the string itself.
+
+    Keying on the resolved string (not the emoji name) keeps results valid across
+    emoji refreshes: a re-uploaded emoji has a new ID and therefore a new cache entry.
+    The returned objects are shared, so callers must not mutate them.
+    """
+    return ipy.PartialEmoji.from_str(emoji_str)
+
+
+def get_partial_emoji(emoji_name: str) -> ipy.PartialEmoji | None:
+    """
+    Retrieves an application emoji as a PartialEmoji for use in components.
+
+    Args:
+        emoji_name (str): The name of the emoji to retrieve.
+
+    Returns:
+        ipy.PartialEmoji | None: The parsed emoji, shared between callers.
+    """
+    return _parse_partial_emoji(get_app_emoji(emoji_name))
+
+
+def get_townhall_emoji(town_hall: int) -> ipy.PartialEmoji | None:
+    """
+    Retrieves the Town Hall emoji of a given level as a PartialEmoji.
+
+    Args:
+        town_hall (int): The Town Hall level.
+
+    Returns:
+        ipy.PartialEmoji | None: The parsed emoji, shared between callers.
+    """
+    return get_partial_emoji(f"Townhall{town_hall}")
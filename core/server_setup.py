@@ -21,6 +21,7 @@ Dependencies:
 """
 
 import interactions as ipy
+import functools
 import json
 import os
 
@@ -103,6 +104,9 @@ def save_config(data):
     with open(CONFIG_FILE, 'w') as f:
         json.dump(data, f, indent=4)
 
+    # Cached GuildConfig instances were built from the old file contents
+    invalidate_config_cache()
+
 def update_server_config_bulk(guild_id, category, updates):
     """
     Updates multiple settings within a specific configuration category.
@@ -230,10 +234,24 @@ class GuildConfig:
     @property
     def PARTNER_TICKETS_CATEGORY(self): return self.categories.get("PARTNER_TICKETS_CATEGORY")
 
-def get_config(guild_id: int) -> GuildConfig:
-    """Factory function to get a config instance for a guild."""
+@functools.lru_cache(maxsize=256)
+def _cached_get_config(guild_id: int) -> GuildConfig:
+    """Builds and memoizes the config instance of a guild."""
     return GuildConfig(guild_id)
 
+def get_config(guild_id: int) -> GuildConfig:
+    """
+    Factory function to get a config instance for a guild.
+
+    Instances are cached per guild so repeated lookups don't re-read the config file.
+    The cache is cleared whenever the configuration is saved.
+    """
+    return _cached_get_config(int(guild_id))
+
+def invalidate_config_cache():
+    """Drops all cached GuildConfig instances so the next lookup re-reads the file."""
+    _cached_get_config.cache_clear()
+
 # --- The Extension / Cog ---
 class Setup(ipy.Extension):
     """
@@ -18,11 +18,16 @@ Dependencies:
     - core (Internal configuration and emoji management)
 """
 
+import asyncio
+import contextlib
 import inspect
 import json
 import re
 import sys
 import os
+import tempfile
+import time
+from urllib.parse import urlparse
 from typing import Iterable, Coroutine, Callable
 from core import server_setup as sc
 
@@ -36,14 +41,54 @@ from coc import utils
 from core.models import InvalidTagError
 from core.emojis_manager import *
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speed-up for the data files; the standard library is used without it
+    orjson = None
+
 # ==========================================
 # GLOBAL CACHE & CONSTANTS
 # ==========================================
 
 # In-memory storage to reduce API calls for frequently accessed data
+# clan_cache holds (fetch time, clan) so entries expire after CLAN_CACHE_TTL seconds.
+# player_cache is refreshed and cleared by the scheduled tasks in cogs/general/tasks.py.
 clan_cache = {}
 player_cache = {}
 overwrites_cache = {}
+CLAN_CACHE_TTL = 600
+API_CACHE_LIMIT = 5000
+
+# Parsed JSON data files, keyed by path: {path: ((mtime_ns, size), data)}
+json_cache = {}
+# One lock per data file so concurrent writers don't interleave
+json_locks = {}
+# Debounced writes waiting to be flushed: {path: (data, indent)} and their flush tasks
+pending_json_writes = {}
+json_flush_tasks = {}
+JSON_FLUSH_DELAY = 0.25
+
+# Lowest FWA Town Hall requirement and the clans_config.json cache entry it was derived from
+min_fwa_req_cache: tuple[tuple | None, int] = (None, 13)
+
+# Every player tag linked in member_tags.json and the cache entry of the file it was built from
+linked_tags_cache: tuple[tuple | None, set[str]] = (None, set())
+
+# HTTP session shared by the image link checks, created on first use
+http_session: aiohttp.ClientSession | None = None
+# Image types accepted for screenshot links, by Content-Type and by file extension
+IMAGE_CONTENT_TYPES = ("image/png", "image/jpeg", "image/jpg")
+IMAGE_SUFFIXES = (".png", ".jpeg", ".jpg")
+
+# Precompiled patterns for the string helpers that run on every interaction
+_INTEGER_RE = re.compile(r'\d+')
+_NON_ALPHA_RE = re.compile(r'[^a-z]')
+
+# Parsed ticket channel identity (topic applicant ID, name username), keyed by channel ID
+channel_owner_cache = {}
+channel_username_cache = {}
+CHANNEL_CACHE_LIMIT = 1024
 
 # Standard color for Embeds (Gold/Tan)
 COLOR = 0xD8AF60
@@ -99,6 +144,15 @@ NUMBER_EMOJIS = {
     6: "6️⃣", 7: "7️⃣", 8: "8️⃣", 9: "9️⃣", 10: "🔟"
 }
 
+# --- Standardized Messages ---
+# Messages shared by the interviews. {error} and {success} are the matching emojis, filled in when the
+# message is sent since application emojis are only available after they are fetched at runtime.
+
+INVALID_TAG_MESSAGE = "{error} Please provide a valid tag in the chat."
+IMAGE_REQUIRED_MESSAGE = "{error} Your response must contain an attachment or a image link."
+NOT_APPLICANT_MESSAGE = "{error} Only the applicant of this channel can start the interview!"
+INTERVIEW_STARTED_MESSAGE = "{success} The interview has started, please answer the questions below."
+
 # --- Standardized Embeds & Components ---
 
 FAIL_EMBED = ipy.Embed(
@@ -139,6 +193,14 @@ FWA_RESTART_BUTTON = ipy.Button(
     emoji=ipy.PartialEmoji(name="↩️")
 )
 
+# Placeholder option of the disabled dropdown shown to accounts without eligible clans.
+# It never changes, so a single instance is shared by every clan selection.
+NO_CLANS_OPTION = ipy.StringSelectOption(
+    label="No Clans Available",
+    value="No Clans Available",
+    description="No Clans Available",
+)
+
 BUG_RESPOND_BUTTON = ipy.Button(
     style=ipy.ButtonStyle.SECONDARY,
     label="Respond",
@@ -247,7 +309,7 @@ def replace_special_char(str_input: str, replacement: str):
 
 def extract_alphabets(input_string: str) -> str:
     """Removes all non-alphabet characters and converts to lowercase (keeps spaces as dashes)."""
-    alphabets_only = re.sub(r'[^a-z]', '', input_string.lower())
+    alphabets_only = _NON_ALPHA_RE.sub('', input_string.lower())
     alphabets_only = alphabets_only.replace(' ', '-')
     return alphabets_only
 
@@ -265,11 +327,96 @@ def extract_integer(input_string: str, index: int = 0) -> int | None:
     if not input_string:
         return None
 
-    match = re.findall(r'\d+', input_string)
+    # The first match is found without scanning the rest of the string
+    if index == 0:
+        match = _INTEGER_RE.search(input_string)
+        return int(match.group()) if match else None
+
+    match = _INTEGER_RE.findall(input_string)
     if match:
         return int(match[index])
     return None
 
+def _cache_put(cache: dict, key, value, limit: int):
+    """
+    Stores a value in a bounded cache dictionary.
+
+    Re-stored keys move to the end, and the oldest entry is evicted once the cache is full.
+    """
+    cache.pop(key, None)
+    if len(cache) >= limit:
+        del cache[next(iter(cache))]
+
+    cache[key] = value
+
+def get_channel_owner_id(channel: ipy.GuildChannel) -> int | None:
+    """
+    Returns the applicant ID stored in a ticket channel's topic.
+
+    The parsed ID is cached per channel and reused for as long as the topic is unchanged
+    (trial commands rewrite the topic, which invalidates the entry).
+
+    Args:
+        channel (ipy.GuildChannel): The ticket channel.
+
+    Returns:
+        int | None: The applicant ID, or None if the topic holds no number.
+    """
+    topic = channel.topic
+    cache_key = int(channel.id)
+
+    cached = channel_owner_cache.get(cache_key)
+    if cached is not None and cached[0] == topic:
+        return cached[1]
+
+    owner_id = extract_integer(topic)
+    _cache_put(channel_owner_cache, cache_key, (topic, owner_id), CHANNEL_CACHE_LIMIT)
+    return owner_id
+
+def get_channel_username(channel: ipy.GuildChannel) -> str | None:
+    """
+    Returns the username part of a ticket channel name (format: prefix┃username).
+
+    The result is cached per channel and reused for as long as the name is unchanged.
+
+    Args:
+        channel (ipy.GuildChannel): The ticket channel.
+
+    Returns:
+        str | None: The username part, or None if the name has no separator.
+    """
+    name = channel.name
+    cache_key = int(channel.id)
+
+    cached = channel_username_cache.get(cache_key)
+    if cached is not None and cached[0] == name:
+        return cached[1]
+
+    _, sep, username = name.partition("┃")
+    username = username if sep else None
+    _cache_put(channel_username_cache, cache_key, (name, username), CHANNEL_CACHE_LIMIT)
+    return username
+
+def verify_applicant(ctx: ipy.BaseContext) -> bool:
+    """
+    Checks whether the author of an interaction is the applicant of its ticket channel.
+
+    The applicant ID in the channel topic is compared first; the username in the channel
+    name (format: prefix┃username) is only checked as a fallback when the ID doesn't match.
+    Both values are parsed once per channel and served from cache afterwards.
+
+    Args:
+        ctx (ipy.BaseContext): The context of the interaction.
+
+    Returns:
+        bool: True if the author owns the ticket channel.
+    """
+    if get_channel_owner_id(ctx.channel) == ctx.author.id:
+        return True
+
+    channel_username = get_channel_username(ctx.channel)
+    return channel_username is not None and extract_alphabets(ctx.author.username) == channel_username
+
 def get_func_params(func: Coroutine | Callable) -> list[str]:
     """Inspects a function and returns a list of its parameter names."""
     sig = inspect.signature(func)
@@ -290,6 +437,29 @@ def hex_to_rgb_integer(hex_code: str) -> int:
     rgb_integer = (r << 16) + (g << 8) + b
     return rgb_integer
 
+async def _iter_valid_tags(client: coc.Client, str_input: str,
+                           context: ipy.SlashContext | ipy.ContextMenuContext | ipy.ModalContext = None,
+                           extract_type: str = "player"):
+    """
+    Yields the valid, formatted tags found in a raw string, validating them one at a time.
+    Shared by `extract_tags` and `extract_first_tag`; see `extract_tags` for the arguments.
+    """
+    sections = replace_special_char(str_input, " ").split(" ")
+
+    for s in sections:
+        if not utils.is_valid_tag(s):
+            continue
+
+        try:
+            await fetch_player(client, s) if extract_type == "player" else await fetch_clan(client, s)
+        except coc.errors.NotFound:
+            if context:
+                await context.send(f"<:error:827078558140334100> `{s}` is invalid.", ephemeral=True)
+
+            continue
+
+        yield utils.correct_tag(s)
+
 async def extract_tags(client: coc.Client, str_input: str,
                        context: ipy.SlashContext | ipy.ContextMenuContext | ipy.ModalContext = None,
                        extract_type: str = "player") -> list[str] | list:
@@ -308,40 +478,300 @@ async def extract_tags(client: coc.Client, str_input: str,
     Returns:
         list[str]: A list of valid, formatted tags.
     """
-    valid_tags = []
-    sections = replace_special_char(str_input, " ").split(" ")
+    return [tag async for tag in _iter_valid_tags(client, str_input, context, extract_type)]
 
-    for s in sections:
-        if not utils.is_valid_tag(s):
-            continue
+async def extract_first_tag(client: coc.Client, str_input: str,
+                            context: ipy.SlashContext | ipy.ContextMenuContext | ipy.ModalContext = None,
+                            extract_type: str = "player") -> str | None:
+    """
+    Extracts the first valid Clash of Clans tag from a raw string.
 
-        try:
-            await fetch_player(client, s) if extract_type == "player" else await fetch_clan(client, s)
-        except coc.errors.NotFound:
-            if context:
-                await context.send(f"<:error:827078558140334100> `{s}` is invalid.", ephemeral=True)
+    Like `extract_tags`, but stops validating (and calling the API) after the first valid tag.
 
-            continue
+    Args:
+        client (coc.Client): API client for validation.
+        str_input (str): The input string containing tags.
+        context (ipy.Context, optional): Context to report errors to the user.
+        extract_type (str): "player" or "clan" to specify validation endpoint.
+
+    Returns:
+        str | None: The first valid, formatted tag, or None if there is none.
+    """
+    async with contextlib.aclosing(_iter_valid_tags(client, str_input, context, extract_type)) as tags:
+        async for tag in tags:
+            return tag
 
-        valid_tags.append(utils.correct_tag(s))
+    return None
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """Returns the shared HTTP session, opening a new one if it doesn't exist or was closed."""
+    global http_session
 
-    return valid_tags
+    if http_session is None or http_session.closed:
+        http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+    return http_session
 
 async def is_url_image(image_url):
     """
-    Verifies if a URL points to a valid image file by checking Content-Type headers.
+    Verifies if a URL points to a valid image file.
+
+    Links whose path ends in an image extension (e.g. Discord attachment URLs) are accepted
+    without a request. Other links are checked with a HEAD request on the shared session,
+    judged by their Content-Type header.
     """
-    image_formats = ("image/png", "image/jpeg", "image/jpg")
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.head(image_url) as r:
-                content_type = r.headers.get("content-type")
-                if content_type in image_formats:
-                    return True
-                return False
-    except:
+        if urlparse(image_url).path.lower().endswith(IMAGE_SUFFIXES):
+            return True
+
+        async with _get_http_session().head(image_url, allow_redirects=True) as r:
+            content_type = r.headers.get("content-type")
+            if content_type in IMAGE_CONTENT_TYPES:
+                return True
+            return False
+    except Exception:
+        # Cancellation (e.g. an interview deadline) is not swallowed
+        return False
+
+async def close_http_session():
+    """Closes the shared HTTP session, if one is open. Called when the bot shuts down."""
+    global http_session
+
+    if http_session is not None and not http_session.closed:
+        await http_session.close()
+    http_session = None
+
+
+# ==========================================
+# DATA FILE STORAGE
+# ==========================================
+
+def _file_signature(path: str) -> tuple[int, int]:
+    """Returns a cheap fingerprint (modification time, size) of a file on disk."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def load_json(path: str):
+    """
+    Loads a JSON data file, reusing the parsed data while the file is unchanged on disk.
+
+    A `stat` call decides whether the cached copy is still valid, so files written by
+    other extensions are picked up on the next load.
+    The returned object is shared between callers: only mutate it when the change is
+    written back with `store_json`, otherwise copy it first.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        Any: The parsed file contents.
+    """
+    cached = json_cache.get(path)
+    if cached is not None and cached[0] == _file_signature(path):
+        return cached[1]
+
+    with open(path, "rb") as file:
+        signature = os.fstat(file.fileno())
+        raw = file.read()
+
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+
+    json_cache[path] = ((signature.st_mtime_ns, signature.st_size), data)
+    return data
+
+async def fetch_json(path: str):
+    """
+    Loads a JSON data file without blocking the event loop.
+
+    The freshness check is a single `stat` call done inline; only when the file changed
+    on disk is `load_json` (read and parse) run in a worker thread.
+
+    Args:
+        path (str): The path of the JSON file.
+
+    Returns:
+        Any: The parsed file contents, shared with other callers (see `load_json`).
+    """
+    cached = json_cache.get(path)
+    if cached is not None and cached[0] == _file_signature(path):
+        return cached[1]
+
+    return await asyncio.to_thread(load_json, path)
+
+def _dump_json(data, indent: int | None) -> bytes:
+    """
+    Serializes data to JSON bytes.
+
+    Compact files use orjson when it is available. Indented files always go through the
+    standard library, since orjson only supports two-space indentation and the existing
+    files are written with `indent` spaces; this keeps every file in one on-disk format.
+    """
+    if indent is None:
+        if orjson:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+    return json.dumps(data, indent=indent).encode()
+
+def _write_bytes(path: str, payload: bytes):
+    """
+    Atomically replaces the contents of a file with bytes.
+
+    The payload goes to a temporary file in the same directory, which is flushed to disk
+    and then swapped in with `os.replace`. Readers see either the old or the new file,
+    never a partially written one, and a crash mid-write leaves the original intact.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+            file.flush()
+            os.fsync(file.fileno())
+        # mkstemp creates the file owner-only, so carry over the permissions of the file it replaces
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(temp_path, os.stat(path).st_mode & 0o777)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+async def store_json(path: str, data, indent: int | None = 4):
+    """
+    Writes data to a JSON file without blocking the event loop.
+
+    The data is serialized on the event loop (so it can't change mid-write) and the
+    file write runs in a worker thread. Writers of the same file are serialized by a lock.
+
+    Args:
+        path (str): The path of the JSON file.
+        data (Any): The data to write.
+        indent (int | None): Indentation of the written JSON, None for a compact file.
+    """
+    payload = _dump_json(data, indent)
+    lock = json_locks.setdefault(path, asyncio.Lock())
+
+    async with lock:
+        await asyncio.to_thread(_write_bytes, path, payload)
+        # A write queued in the meantime holds newer data, so keep serving it until it is flushed
+        pending = pending_json_writes.get(path)
+        json_cache[path] = (_file_signature(path), pending[0] if pending else data)
+
+def queue_store_json(path: str, data, indent: int | None = 4):
+    """
+    Schedules a background write of a JSON data file, coalescing bursts of writes.
+
+    Loads through `load_json`/`fetch_json` see the new data immediately. The file itself
+    is written once `JSON_FLUSH_DELAY` seconds have passed, so several updates within
+    that window cost a single disk write.
+
+    Args:
+        path (str): The path of the JSON file.
+        data (Any): The data to write.
+        indent (int | None): Indentation of the written JSON, None for a compact file.
+    """
+    json_cache[path] = (_file_signature(path), data)
+    pending_json_writes[path] = (data, indent)
+
+    if path not in json_flush_tasks:
+        json_flush_tasks[path] = asyncio.create_task(_flush_json(path))
+
+async def _flush_json(path: str):
+    """Waits for the debounce window to pass, then writes the latest queued data of a file."""
+    await asyncio.sleep(JSON_FLUSH_DELAY)
+    json_flush_tasks.pop(path, None)
+    data, indent = pending_json_writes.pop(path)
+
+    try:
+        # Re-validate against the file before writing: if it was changed on disk by something other
+        # than these helpers since the data was queued, the queued copy is stale and must not replace it.
+        cached = json_cache.get(path)
+        if cached is None or cached[1] is not data or cached[0] != _file_signature(path):
+            print(f"✕ Dropped the queued write of {path}: the file changed on disk after it was queued")
+            return
+
+        await store_json(path, data, indent)
+    except Exception as e:
+        print(f"✕ Failed to save {path}: {e}")
+
+async def get_min_fwa_req() -> int:
+    """
+    Returns the lowest Town Hall requirement among the FWA clans in `clans_config.json`.
+
+    The value is reused until the cached config entry is replaced, i.e. until the file
+    is written with `store_json`/`queue_store_json` or changes on disk.
+
+    Returns:
+        int: The minimum Town Hall level, 13 if no FWA clan is configured.
+    """
+    global min_fwa_req_cache
+
+    clans_config = await fetch_json("data/clans_config.json")
+    source = json_cache.get("data/clans_config.json")
+
+    if min_fwa_req_cache[0] is not source:
+        min_fwa_req = min(
+            (extract_integer(value["requirement"]) for value in clans_config.values() if value["type"] == "FWA"),
+            default=13
+        )
+        min_fwa_req_cache = (source, min_fwa_req)
+
+    return min_fwa_req_cache[1]
+
+async def fetch_linked_tags() -> set[str]:
+    """
+    Returns the set of every player tag linked to a member in `member_tags.json`.
+
+    The set is rebuilt only when the cached file entry is replaced, so membership checks
+    don't scan every member's links. Writing the links with `store_json` replaces the
+    entry, so newly linked tags show up once they are saved.
+
+    Returns:
+        set[str]: The linked player tags, shared between callers; do not mutate it.
+    """
+    global linked_tags_cache
+
+    player_links = await fetch_json("data/member_tags.json")
+    source = json_cache.get("data/member_tags.json")
+
+    if linked_tags_cache[0] is not source:
+        linked_tags_cache = (source, {tag for tags in player_links.values() for tag in tags})
+
+    return linked_tags_cache[1]
+
+async def update_player_links(user_id: int | str, new_tags: Iterable[str] = (),
+                              stale_tags: Iterable[str] = ()) -> bool:
+    """
+    Applies link changes to `member_tags.json`.
+
+    Callers don't edit the shared links data while they wait on Discord or the API;
+    they collect the changes and apply them here in one go on freshly loaded links,
+    saved at once under the file lock. An abandoned command leaves nothing behind and
+    links written by other commands in the meantime are kept.
+
+    Args:
+        user_id (int | str): The Discord ID of the member.
+        new_tags (Iterable[str]): Tags to link, skipped if already linked to any member.
+        stale_tags (Iterable[str]): Tags to remove from the member's links.
+
+    Returns:
+        bool: True if the links changed and were written.
+    """
+    stale_tags = set(stale_tags)
+    linked_tags = await fetch_linked_tags()
+    # Loaded after the set so both come from the same version of the file (a stat call if unchanged)
+    player_links = await fetch_json("data/member_tags.json")
+
+    key = str(user_id)
+    current_tags = player_links.get(key, [])
+    user_tags = [tag for tag in current_tags if tag not in stale_tags]
+    user_tags += [tag for tag in dict.fromkeys(new_tags) if tag not in linked_tags]
+
+    if user_tags == current_tags:
         return False
 
+    # Nothing is awaited between the edit and the write, so no other coroutine sees a half-applied change
+    player_links[key] = user_tags
+    await store_json("data/member_tags.json", player_links)
+    return True
 
 # ==========================================
 # API CACHING WRAPPERS
@@ -350,6 +780,8 @@ async def is_url_image(image_url):
 async def fetch_clan(client: coc.Client, clan_tag: str, update: bool = False) -> coc.Clan:
     """
     Retrieves clan data from the API, using a local cache to minimize requests.
+    Cached clans are reused for `CLAN_CACHE_TTL` seconds, so member counts and
+    league data don't go stale for the lifetime of the process.
 
     Args:
         client (coc.Client): The API client.
@@ -364,15 +796,17 @@ async def fetch_clan(client: coc.Client, clan_tag: str, update: bool = False) ->
     """
     cache_key = coc.utils.correct_tag(clan_tag)
 
-    if not update and cache_key in clan_cache:
-        return clan_cache[cache_key]
+    if not update:
+        cached = clan_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < CLAN_CACHE_TTL:
+            return cached[1]
 
     try:
         result = await client.get_clan(cache_key)
     except coc.errors.NotFound:
         raise InvalidTagError(cache_key, "clan")
 
-    clan_cache[cache_key] = result
+    _cache_put(clan_cache, cache_key, (time.monotonic(), result), API_CACHE_LIMIT)
 
     return result
 
@@ -402,7 +836,7 @@ async def fetch_player(client: coc.Client, player_tag: str, update: bool = False
     except coc.errors.NotFound:
         raise InvalidTagError(cache_key, "player")
 
-    player_cache[cache_key] = result
+    _cache_put(player_cache, cache_key, result, API_CACHE_LIMIT)
 
     return result
 
@@ -439,7 +873,7 @@ async def initialize_cache(bot: ipy.Client, client: coc.Client, apply_categories
     Loads all configured alliance clans and fetches application emojis.
     """
     # Load Alliance Data
-    clans_config = json.load(open(f"data/clans_config.json", "r"))
+    clans_config = await fetch_json("data/clans_config.json")
     for clan_tag in clans_config:
         await fetch_clan(client, clan_tag)
 
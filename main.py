@@ -25,7 +25,7 @@ import interactions as ipy
 import coc
 import truststore
 from dotenv import load_dotenv
-from core.utils import get_extensions
+from core.utils import get_extensions, close_http_session
 
 # Initialize environment variables from .env file
 load_dotenv()
@@ -135,7 +135,11 @@ async def main():
             print(f"Failed to load {extension} extension: {e}", file=sys.stderr)
 
     # Begin the Discord Gateway connection
-    await bot.astart()
+    try:
+        await bot.astart()
+    finally:
+        # Release the HTTP session shared by the image link checks
+        await close_http_session()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file